@@ -16,6 +16,11 @@
 import json
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,14 +35,27 @@ class KafkaWriter:
     def producer(self):
         return self._producer
 
-    def write_data(self, message):
-        self.producer.produce(self._kafka_topic, message.encode('utf-8'))
+    @staticmethod
+    def _delivery_report(err, msg):
+        if err is not None:
+            logger.error("Failed to deliver message to topic %s: %s", msg.topic(), err)
+
+    def write_data(self, message: str | bytes):
+        # The producer accepts both str and bytes payloads, avoid creating an intermediate encoded copy
+        self.producer.produce(self._kafka_topic, message, on_delivery=self._delivery_report)
+
+        # Serve delivery reports from previous produce calls without blocking on the broker
+        self.producer.poll(0)
+
         if len(self.producer) >= self._batch_size:
             logger.info(
-                "Batch reached, calling poll... producer unsent: %s",
+                "Batch reached, calling flush... producer unsent: %s",
                 len(self.producer),
             )
-            self.producer.flush()
+            self.flush_pending()
+
+    def flush_pending(self):
+        self.producer.flush()
 
     def close(self):
         logger.info("Closing kafka writer...")
@@ -49,7 +67,9 @@ class KafkaWriter:
 def process_cm(request):
     control_messages_json = request.form.get("control-messages-json")
 
-    logging.info("Received control message: %s", control_messages_json)
+    # Avoid formatting potentially large payloads unless debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received control message: %s", control_messages_json)
 
     return control_messages_json
 
@@ -58,8 +78,22 @@ def generate_success_message(control_messages_json):
     sucess_message = {
         "status": "Successfully published control message to kafka topic.",
         "status_code": 200,
-        "control_messages": json.loads(control_messages_json)
+        "control_messages": _json_loads(control_messages_json)
     }
 
-    sucess_message = json.dumps(sucess_message, indent=4)
-    return sucess_message
+    return _json_dumps(sucess_message)
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    # orjson returns bytes which Flask can send as-is without an additional str -> bytes encode
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    return json.dumps(obj, indent=4)
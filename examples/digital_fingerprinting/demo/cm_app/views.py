@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
 import logging
 
 from cm_app.helper import KafkaWriter
@@ -32,11 +33,19 @@ KAFKA_WRITER = None
 @app.before_first_request
 def setup():
     app.logger.setLevel(logging.INFO)
-    producer = Producer({'bootstrap.servers': 'localhost:9092'})
+    # A single producer is shared by all requests, allowing librdkafka to batch messages across requests
+    producer = Producer({
+        'bootstrap.servers': 'localhost:9092',
+        'linger.ms': 20,
+        'batch.size': 65536,
+        'compression.type': 'lz4',
+        'acks': 1,
+    })
     app.logger.info("Initialized Kafka producer")
     # pylint: disable=global-statement
     global KAFKA_WRITER
-    KAFKA_WRITER = KafkaWriter(kafka_topic="test_cm", batch_size=1, producer=producer)
+    KAFKA_WRITER = KafkaWriter(kafka_topic="test_cm", batch_size=100, producer=producer)
+    atexit.register(KAFKA_WRITER.close)
     app.logger.info("Initialized Kafka writer")
 
 
@@ -47,7 +56,7 @@ def submit_messages():
         control_messages_json = process_cm(request)
         KAFKA_WRITER.write_data(control_messages_json)
         sucess_message = generate_success_message(control_messages_json)
-        return sucess_message
+        return app.response_class(sucess_message, status=200, mimetype="application/json")
 
     if request.method == "GET":
         return render_template("submit_messages.html")
@@ -60,7 +69,7 @@ def training():
         control_messages_json = process_cm(request)
         KAFKA_WRITER.write_data(control_messages_json)
         sucess_message = generate_success_message(control_messages_json)
-        return sucess_message
+        return app.response_class(sucess_message, status=200, mimetype="application/json")
 
     if request.method == "GET":
         return render_template("training.html")
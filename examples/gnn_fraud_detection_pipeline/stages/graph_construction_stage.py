@@ -73,8 +73,8 @@ class FraudGraphConstructionStage(SinglePortStage):
         meta_cols = ['client_node', 'merchant_node', 'index']
         graph, node_features = build_fsi_graph(graph_data, meta_cols)
 
-        # Convert to torch.tensor from cupy
-        test_index = torch.from_dlpack(test_index.values.toDlpack()).long()
+        # Convert to torch.tensor from cupy, using the id type of the graph
+        test_index = torch.from_dlpack(test_index.values.toDlpack()).to(graph.idtype)
         node_features = node_features.float()
 
         message.set_metadata("graph", graph)
@@ -36,7 +36,7 @@ class GraphSAGEStage(SinglePortStage):
     def __init__(self,
                  config: Config,
                  model_dir: str,
-                 batch_size: int = 100,
+                 batch_size: int = 4096,
                  record_id: str = "index",
                  target_node: str = "transaction"):
         super().__init__(config)
@@ -61,7 +61,8 @@ class GraphSAGEStage(SinglePortStage):
 
     def _process_message(self, message: ControlMessage) -> ControlMessage:
 
-        node_identifiers = list(message.payload().get_data(self._record_id).to_pandas())
+        # Convert the column with a single copy from the device, rather than iterating over a pandas copy of it
+        node_identifiers = message.payload().get_data(self._record_id).to_arrow().to_pylist()
 
         # Perform inference
         inductive_embedding, _ = self._dgl_model.inference(message.get_metadata("graph"),
@@ -26,6 +26,8 @@ from torch.nn import functional as F
 
 import cudf as cf
 
+_MODEL_READ_BUFFER_SIZE = 1 << 20
+
 
 class BaseHeteroGraph(nn.Module):
     """
@@ -92,9 +94,9 @@ class BaseHeteroGraph(nn.Module):
         predictions, embedding = self(input_graph, features)
         return nn.Sigmoid()(predictions), embedding
 
-    @torch.no_grad()
-    def evaluate(self, eval_loader: dgl.dataloading.DataLoader, feature_tensors: torch.Tensor,
-                 target_node: str) -> (torch.Tensor, torch.Tensor, torch.Tensor):
+    @torch.inference_mode()
+    def evaluate(self, eval_loader: dgl.dataloading.DataLoader, feature_tensors: torch.Tensor, target_node: str,
+                 num_nodes: int) -> (torch.Tensor, torch.Tensor, torch.Tensor):
         """Evaluate the specified model on the given evaluation input graph
 
         Parameters
@@ -106,6 +108,8 @@ class BaseHeteroGraph(nn.Module):
             Shape: (num_samples, num_features).
         target_node : str
             The target node for evaluation, indicating the node of interest.
+        num_nodes : int
+            The total number of target nodes yielded by `eval_loader`, used to allocate the outputs up front.
 
         Returns
         -------
@@ -114,9 +118,10 @@ class BaseHeteroGraph(nn.Module):
         """
 
         self.eval()
-        eval_logits = []
-        eval_seeds = []
-        embedding = []
+        eval_logits = None
+        eval_seeds = None
+        embedding = None
+        offset = 0
 
         for _, output_nodes, blocks in eval_loader:
 
@@ -125,13 +130,23 @@ class BaseHeteroGraph(nn.Module):
             nid = blocks[0].srcnodes[target_node].data[dgl.NID]
             input_features = feature_tensors[nid]
             logits, embedd = self.infer(blocks, input_features)
-            eval_logits.append(logits.cpu().detach())
-            eval_seeds.append(seed)
-            embedding.append(embedd)
 
-        eval_logits = torch.cat(eval_logits)
-        eval_seeds = torch.cat(eval_seeds)
-        embedding = torch.cat(embedding)
+            if eval_logits is None:
+                # The output widths are only known once the first batch has been evaluated. The outputs are kept on
+                # the device and the logits are copied to the host once all batches have been evaluated
+                eval_logits = logits.new_empty((num_nodes, *logits.shape[1:]))
+                eval_seeds = seed.new_empty((num_nodes, ))
+                embedding = embedd.new_empty((num_nodes, *embedd.shape[1:]))
+
+            next_offset = offset + len(seed)
+            eval_logits[offset:next_offset] = logits
+            eval_seeds[offset:next_offset] = seed
+            embedding[offset:next_offset] = embedd
+            offset = next_offset
+
+        eval_logits = eval_logits[:offset].cpu()
+        eval_seeds = eval_seeds[:offset]
+        embedding = embedding[:offset]
         return eval_logits, eval_seeds, embedding
 
     def inference(self,
@@ -139,7 +154,7 @@ class BaseHeteroGraph(nn.Module):
                   feature_tensors: torch.Tensor,
                   test_idx: torch.Tensor,
                   target_node: str = "transaction",
-                  batch_size: int = 100) -> (torch.Tensor, torch.Tensor):
+                  batch_size: int = 4096) -> (torch.Tensor, torch.Tensor):
         """
         Perform inference on a given model using the provided input graph and feature tensors.
 
@@ -154,8 +169,9 @@ class BaseHeteroGraph(nn.Module):
             The indices of the nodes in the input graph that are used for testing and evaluation.
         target_node : str, optional (default: "transaction")
             The type of node for which inference will be performed. By default, it is set to "transaction".
-        batch_size : int, optional (default: 100)
-            The batch size used during inference to process data in mini-batches.
+        batch_size : int, optional (default: 4096)
+            The batch size used during inference to process data in mini-batches. Larger batches reduce the number of
+            sampling and model invocations, at the cost of device memory.
 
         Returns
         -------
@@ -165,15 +181,17 @@ class BaseHeteroGraph(nn.Module):
             The seed of the target nodes used for inference.
         """
 
-        # create sampler and test dataloaders
+        # create sampler and test dataloaders. Worker processes aren't used, the graph resides on the device where the
+        # sampling is also performed
         full_sampler = dgl.dataloading.MultiLayerFullNeighborSampler(num_layers=3)
-        test_dataloader = dgl.dataloading.DataLoader(input_graph, {target_node: test_idx},
+        # The seed nodes must have the same id type as the graph
+        test_dataloader = dgl.dataloading.DataLoader(input_graph, {target_node: test_idx.to(input_graph.idtype)},
                                                      full_sampler,
                                                      batch_size=batch_size,
                                                      shuffle=False,
                                                      drop_last=False,
                                                      num_workers=0)
-        _, test_seed, test_embedding = self.evaluate(test_dataloader, feature_tensors, target_node)
+        _, test_seed, test_embedding = self.evaluate(test_dataloader, feature_tensors, target_node, len(test_idx))
 
         return test_embedding, test_seed
 
@@ -392,9 +410,16 @@ def load_model(model_dir: str,
         model, training graph, hyperparameter
     """
 
-    with open(os.path.join(model_dir, "graph.pkl"), 'rb') as f:
-        graph = pickle.load(f)
-    with open(os.path.join(model_dir, 'hyperparams.pkl'), 'rb') as f:
+    graph_file = os.path.join(model_dir, "graph.bin")
+    if os.path.exists(graph_file):
+        (graph, ), _ = dgl.load_graphs(graph_file)
+    else:
+        # Models saved prior to using DGL's native serialization only contain a pickled graph. Read the pickles with a
+        # larger buffer, reducing the number of reads when the model directory is on a network FS
+        with open(os.path.join(model_dir, "graph.pkl"), 'rb', buffering=_MODEL_READ_BUFFER_SIZE) as f:
+            graph = pickle.load(f)
+
+    with open(os.path.join(model_dir, 'hyperparams.pkl'), 'rb', buffering=_MODEL_READ_BUFFER_SIZE) as f:
         hyperparameters = pickle.load(f)
 
     if device is None:
@@ -447,15 +472,17 @@ def build_fsi_graph(train_data: cf.DataFrame, col_drop: list[str]) -> (dgl.DGLHe
     >>> graph, features = build_heterograph(train_data, col_drop)
     """
 
-    feature_tensors = train_data.drop(col_drop, axis=1).values
+    # Convert directly to float32 on the device, the features would otherwise be materialized in their common dtype
+    # (typically float64) and later converted to float32 by the caller
+    feature_tensors = train_data.drop(col_drop, axis=1).to_cupy(dtype=cupy.float32)
     feature_tensors = torch.from_dlpack(feature_tensors.toDlpack())
     feature_tensors = (feature_tensors - feature_tensors.mean(0, keepdim=True)) / (0.0001 +
                                                                                    feature_tensors.std(0, keepdim=True))
     # Create client, merchant, transaction node id tensors & move to torch.tensor
     # col_drop column expected to be in ['client','merchant', 'transaction'] order to match
-    # torch.tensor_split order
+    # torch.tensor_split order. The ids are stored as int32, halving the memory of the graph structure
     client_tensor, merchant_tensor, transaction_tensor = torch.tensor_split(
-        torch.from_dlpack(train_data[col_drop].values.toDlpack()).long(), 3, dim=1)
+        torch.from_dlpack(train_data[col_drop].to_cupy(dtype=cupy.int32).toDlpack()), 3, dim=1)
 
     client_tensor, merchant_tensor, transaction_tensor = (client_tensor.view(-1),
                                                           merchant_tensor.view(-1),
@@ -467,7 +494,7 @@ def build_fsi_graph(train_data: cf.DataFrame, col_drop: list[str]) -> (dgl.DGLHe
         ('transaction', 'issued', 'merchant'): (transaction_tensor, merchant_tensor),
         ('merchant', 'sell', 'transaction'): (merchant_tensor, transaction_tensor)
     }
-    graph = dgl.heterograph(edge_list)
+    graph = dgl.heterograph(edge_list, idtype=torch.int32)
 
     return graph, feature_tensors
 
@@ -491,17 +518,19 @@ def prepare_data(
     """
 
     train_size = training_data.shape[0]
-    cdf = cf.concat([training_data, test_data], axis=0)
-    labels = cdf['fraud_label'].values
+    labels = cf.concat([training_data['fraud_label'], test_data['fraud_label']]).values
 
-    # Drop non-feature columns
-    cdf.drop(['fraud_label', 'index'], inplace=True, axis=1)
+    # Exclude the non-feature columns prior to concatenating, avoiding copying them only to drop them afterwards
+    non_feature_cols = ['fraud_label', 'index']
+    feature_cols = [col for col in training_data.columns if col not in non_feature_cols]
+    cdf = cf.concat([training_data[feature_cols], test_data[feature_cols]], axis=0)
 
     # Create index of node features
     cdf.reset_index(inplace=True)
     meta_cols = ['client_node', 'merchant_node']
     for col in meta_cols:
-        cdf[col] = cf.CategoricalIndex(cdf[col]).codes
+        # Sorted to produce the same codes as a categorical, which the trained node embeddings are indexed by
+        cdf[col], _ = cdf[col].factorize(sort=True)
 
     train_data, test_data, train_index, test_index, all_data = (cdf.iloc[:train_size, :],
                                                                 cdf.iloc[train_size:, :],
@@ -40,7 +40,6 @@ from tqdm import trange
 from xgboost import XGBClassifier
 
 import cudf as cf
-from cuml import ForestInference
 
 np.random.seed(1001)
 torch.manual_seed(1001)
@@ -183,7 +182,8 @@ def prepare_data(training_data, test_data):
     cdf.reset_index(inplace=True)
     meta_cols = ['client_node', 'merchant_node']
     for col in meta_cols:
-        cdf[col] = cf.CategoricalIndex(cdf[col]).codes
+        # Sorted to produce the same codes as a categorical, which the trained node embeddings are indexed by
+        cdf[col], _ = cdf[col].factorize(sort=True)
 
     return (cdf.iloc[:train_size, :],
             cdf.iloc[train_size:, :],
@@ -220,8 +220,7 @@ def save_model(graph, model, hyperparameters, xgb_model, model_dir):
     torch.save(model.state_dict(), os.path.join(model_dir, 'model.pt'))
     with open(os.path.join(model_dir, 'hyperparams.pkl'), 'wb') as f:
         pickle.dump(hyperparameters, f)
-    with open(os.path.join(model_dir, 'graph.pkl'), 'wb') as f:
-        pickle.dump(graph, f)
+    dgl.save_graphs(os.path.join(model_dir, 'graph.bin'), [graph])
     xgb_model.save_model(os.path.join(model_dir, "xgb.pt"))
 
 
@@ -237,12 +236,16 @@ def load_model(model_dir, gnn_model=HinSAGE):
 
     Returns
     -------
-    (nn.Module, dgl.DGLHeteroGraph, dict)
-        model, training graph, hyperparameter
+    (nn.Module, ForestInference, dgl.DGLHeteroGraph)
+        model, XGBoost model or None when the model directory doesn't contain one, training graph
     """
 
-    with open(os.path.join(model_dir, "graph.pkl"), 'rb') as f:
-        graph = pickle.load(f)
+    graph_file = os.path.join(model_dir, "graph.bin")
+    if os.path.exists(graph_file):
+        (graph, ), _ = dgl.load_graphs(graph_file)
+    else:
+        with open(os.path.join(model_dir, "graph.pkl"), 'rb') as f:
+            graph = pickle.load(f)
     with open(os.path.join(model_dir, 'hyperparams.pkl'), 'rb') as f:
         hyperparameters = pickle.load(f)
     model = gnn_model(graph,
@@ -253,7 +256,13 @@ def load_model(model_dir, gnn_model=HinSAGE):
                       embedding_size=hyperparameters['embedding_size'],
                       target=hyperparameters['target_node'])
     model.load_state_dict(torch.load(os.path.join(model_dir, 'model.pt')))
-    xgb_model = ForestInference.load(os.path.join(model_dir, 'xgb.pt'), output_class=True)
+
+    xgb_model = None
+    xgb_file = os.path.join(model_dir, 'xgb.pt')
+    if os.path.exists(xgb_file):
+        # Importing cuML is expensive, only do so when there is an XGBoost model to load
+        from cuml import ForestInference
+        xgb_model = ForestInference.load(xgb_file, output_class=True)
 
     return model, xgb_model, graph
 
@@ -49,7 +49,8 @@ torch.manual_seed(1001)
 @click.option('--target-node', help="Target node", default="transaction")
 @click.option('--output-file', help="Path to csv inference result", default="out.csv")
 @click.option('--model-type', help="Model type either RGCN/Graphsage", default="RGCN")
-def main(training_data, validation_data, model_dir, target_node, output_file, model_type):
+@click.option('--batch-size', help="Number of target nodes to infer in each mini-batch", default=4096)
+def main(training_data, validation_data, model_dir, target_node, output_file, model_type, batch_size):
 
     device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
     meta_cols = ["client_node", "merchant_node", "index"]
@@ -64,7 +65,8 @@ def main(training_data, validation_data, model_dir, target_node, output_file, mo
 
     # build graph structure
     input_graph, feature_tensors = build_fsi_graph(all_data, meta_cols)
-    test_index = torch.from_dlpack(test_index.values.toDlpack()).long()
+    # The index already resides on the device, convert it once to the id type of the graph
+    test_index = torch.from_dlpack(test_index.values.toDlpack()).to(input_graph.idtype)
 
     # Load graph model, return only the gnn model
     model, _, _ = load_model(model_dir, gnn_model=gnn_model)
@@ -76,7 +78,11 @@ def main(training_data, validation_data, model_dir, target_node, output_file, mo
     input_graph = input_graph.to(device)
 
     # Perform inference
-    test_embedding, test_seeds = model.inference(input_graph, feature_tensors.float(), test_index, target_node)
+    test_embedding, test_seeds = model.inference(input_graph,
+                                                 feature_tensors.float(),
+                                                 test_index,
+                                                 target_node,
+                                                 batch_size=batch_size)
 
     # collect result . XGBoost predict_proba(test_embedding)[:, 1]
     #  indicates probability score of negative class using XGBoost.
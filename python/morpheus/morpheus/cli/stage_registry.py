@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import dataclasses
 import logging
 import typing
@@ -23,6 +24,9 @@ from morpheus.config import PipelineModes
 
 logger = logging.getLogger(__file__)
 
+# Shared by all of the stages which support every mode
+_ALL_MODES = frozenset(PipelineModes)
+
 
 @dataclasses.dataclass
 class StageInfo:
@@ -32,18 +36,19 @@ class StageInfo:
     build_command: typing.Callable[[], click.Command] = dataclasses.field(compare=False, repr=False)
 
     def __post_init__(self):
-        # If modes is None or empty, then convert it to all modes
+        # If modes is None or empty, then convert it to all modes. Stages supporting every mode all share the same set
         if (self.modes is None or len(self.modes) == 0):
-            self.modes = set(PipelineModes)
+            self.modes = _ALL_MODES
+            self._modes_set = _ALL_MODES
+        else:
+            # Modes may be given as a list, keep a set for constant time lookups
+            self._modes_set = frozenset(self.modes)
 
     def supports_mode(self, mode: PipelineModes):
         if (mode is None):
             return True
 
-        if (self.modes is None or len(self.modes) == 0):
-            return True
-
-        return mode in self.modes
+        return mode in self._modes_set
 
 
 @dataclasses.dataclass
@@ -57,14 +62,19 @@ class LazyStageInfo(StageInfo):
         super().__init__(name=name, modes=modes, qualified_name=stage_qualified_name, build_command=self._lazy_build)
 
         # Break the module name up into the class and the package
-        qual_name_split = stage_qualified_name.split(".")
-        if (len(qual_name_split) > 1):
-            self.package_name = ".".join(qual_name_split[:-1])
+        package_name, _, self.class_name = stage_qualified_name.rpartition(".")
+        if (len(package_name) > 0):
+            self.package_name = package_name
 
-        self.class_name = qual_name_split[-1]
+        # The stage info registered by the imported stage class, resolved on the first build
+        self._stage_class_info: typing.Optional[StageInfo] = None
 
     def _lazy_build(self):
 
+        # Stages registered for multiple modes are built once per mode, only resolve the stage class the first time
+        if (self._stage_class_info is not None):
+            return self._stage_class_info.build_command()
+
         import importlib
 
         mod = importlib.import_module(self.package_name)
@@ -82,6 +92,8 @@ class LazyStageInfo(StageInfo):
             raise RuntimeError(f"Class {self.qualified_name} did not have attribute '_morpheus_registered_stage'. \
                 Did you use register_stage?")
 
+        self._stage_class_info = stage_class_info
+
         return stage_class_info.build_command()
 
 
@@ -89,13 +101,10 @@ class StageRegistry:
 
     def __init__(self) -> None:
         # Stages are registered on a per mode basis, different stages can have the same command name for different modes
-        self._registered_stages: typing.Dict[PipelineModes, typing.Dict[str, StageInfo]] = {}
+        self._registered_stages: typing.DefaultDict[PipelineModes, typing.Dict[str, StageInfo]]
+        self._registered_stages = collections.defaultdict(dict)
 
     def _get_stages_for_mode(self, mode: PipelineModes) -> typing.Dict[str, StageInfo]:
-
-        if (mode not in self._registered_stages):
-            self._registered_stages[mode] = {}
-
         return self._registered_stages[mode]
 
     def _add_stage_info(self, mode: PipelineModes, stage: StageInfo):
@@ -139,12 +148,8 @@ class StageRegistry:
 
     def get_registered_names(self, mode: PipelineModes = None) -> typing.List[str]:
 
-        # Loop over all registered stages and validate the mode
-        stage_names: typing.List[str] = [
-            name for name, stage_info in self._get_stages_for_mode(mode).items() if stage_info.supports_mode(mode)
-        ]
-
-        return stage_names
+        # Stages are only added to the modes they support, no need to check the mode of each stage
+        return list(self._get_stages_for_mode(mode).keys())
 
     def _remove_stage_info(self, mode: PipelineModes, stage: StageInfo):
 
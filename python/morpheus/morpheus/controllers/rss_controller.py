@@ -12,20 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import logging
 import os
+import queue
+import re
 import time
 from collections.abc import Callable
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from dataclasses import dataclass
 from datetime import datetime
 from datetime import timedelta
-from urllib.parse import urlparse
 
 import mrc
 import requests
 import requests_cache
+from requests.adapters import HTTPAdapter
 
 from morpheus.messages import MessageMeta
 from morpheus.utils.type_aliases import DataFrameModule
@@ -55,6 +59,15 @@ class FeedStats:
     last_try_result: str
 
 
+@dataclass
+class _CachedFeed:
+    """The feed most recently parsed from a URL, along with what is needed to detect whether it has changed"""
+
+    body_hash: int
+    validators: dict[str, str]
+    feed: "feedparser.FeedParserDict"
+
+
 class RSSController:
     """
     RSSController handles fetching and processing of RSS feed entries.
@@ -74,6 +87,9 @@ class RSSController:
         Enable caching of RSS feed request data.
     cache_dir : str, optional, default = "./.cache/http"
         Cache directory for storing RSS feed request data.
+    cache_backend : str, optional, default = "sqlite"
+        The `requests_cache` backend used when caching is enabled, such as "sqlite", "filesystem" or "redis". The
+        SQLite database and filesystem cache are stored in `cache_dir`.
     cooldown_interval : int, optional, default = 600
          Cooldown interval in seconds if there is a failure in fetching or parsing the feed.
     request_timeout : float, optional, default = 2.0
@@ -95,12 +111,20 @@ class RSSController:
         "title",
     )
 
+    # Upper bound on the number of feeds fetched concurrently
+    MAX_FETCH_WORKERS = 32
+
+    # Matches a URL scheme followed by a non-empty network location, equivalent to checking the `scheme` and `netloc`
+    # of `urllib.parse.urlparse` without building a `ParseResult` for every input
+    _URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.\-]*://[^/?#]+")
+
     def __init__(self,
                  feed_input: str | list[str],
                  batch_size: int = 128,
                  run_indefinitely: bool = None,
                  enable_cache: bool = False,
                  cache_dir: str = "./.cache/http",
+                 cache_backend: str = "sqlite",
                  cooldown_interval: int = 600,
                  request_timeout: float = 2.0,
                  strip_markup: bool = False,
@@ -114,14 +138,20 @@ class RSSController:
         if (isinstance(feed_input, str)):
             feed_input = [feed_input]
 
-        # Convert list to set to remove any duplicate feed inputs.
-        self._feed_input = set(feed_input)
+        # Remove any duplicate feed inputs, preserving the order the feeds are processed in
+        self._feed_input = list(dict.fromkeys(feed_input))
         self._batch_size = batch_size
-        self._previous_entries = set()  # Stores the IDs of previous entries to prevent the processing of duplicates.
+        # Stores fingerprints of the IDs of previous entries to prevent the processing of duplicates. Entry IDs are
+        # often long URLs, only the 64-bit hash of each ID is kept to bound the memory of long running sources.
+        self._previous_entries: set[int] = set()
         self._cooldown_interval = cooldown_interval
         self._request_timeout = request_timeout
         self._strip_markup = strip_markup
 
+        # Resolving relative URIs rewrites the attributes of the markup in each entry, when the markup is stripped from
+        # the entries the attributes are discarded anyway
+        self._parse_kwargs = {"resolve_relative_uris": False} if strip_markup else {}
+
         if should_stop_fn is None:
             self._should_stop_fn = lambda: False
         else:
@@ -144,19 +174,27 @@ class RSSController:
         self._interval_secs = interval_secs
         self._interval_td = timedelta(seconds=self._interval_secs)
         self._df_class: type[DataFrameType] = get_df_class(df_type)
+        self._is_cudf = df_type == "cudf"
 
         self._enable_cache = enable_cache
+        self._cache_backend = cache_backend
 
-        if enable_cache:
-            self._session = requests_cache.CachedSession(os.path.join(cache_dir, "RSSController.sqlite"),
-                                                         backend="sqlite")
+        if (cache_backend == "sqlite"):
+            self._cache_name = os.path.join(cache_dir, "RSSController.sqlite")
+        elif (cache_backend == "filesystem"):
+            self._cache_name = os.path.join(cache_dir, "RSSController")
         else:
-            self._session = requests.session()
+            # Backends such as redis don't store the cache locally, the name is used as a namespace
+            self._cache_name = "RSSController"
 
-        self._session.headers.update({
-            "User-Agent":
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36"
-        })
+        # Sessions are not thread-safe, each concurrent fetch borrows a session of its own from this pool and returns it
+        # afterwards, allowing the sessions to keep their connections alive between polls
+        self._idle_sessions: queue.SimpleQueue[requests.Session] = queue.SimpleQueue()
+        self._session = self._create_session()
+        self._idle_sessions.put(self._session)
+
+        # The last feed parsed from each URL, allowing unchanged feeds to be returned without parsing them again
+        self._cached_feeds: dict[str, _CachedFeed] = {}
 
         self._feed_stats_dict = {
             url:
@@ -164,6 +202,32 @@ class RSSController:
             for url in self._feed_input
         }
 
+    def _create_session(self) -> requests.Session:
+        if self._enable_cache:
+            session = requests_cache.CachedSession(self._cache_name, backend=self._cache_backend)
+        else:
+            session = requests.session()
+
+        # Each session only ever has a single request in flight, so one connection per host is enough. However a
+        # session is handed to whichever worker is free and ends up fetching from every host over time, size the number
+        # of per-host pools to the number of feeds so connections aren't evicted once the default of 10 hosts is reached
+        adapter = HTTPAdapter(pool_connections=max(1, len(self._feed_input)), pool_maxsize=1)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        session.headers.update({
+            "User-Agent":
+                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36"
+        })
+
+        return session
+
+    def _acquire_session(self) -> requests.Session:
+        try:
+            return self._idle_sessions.get_nowait()
+        except queue.Empty:
+            return self._create_session()
+
     @property
     def run_indefinitely(self):
         """Property that determines to run the source indefinitely"""
@@ -252,28 +316,60 @@ class RSSController:
         fallback = False
         cache_hit = False
 
+        # Feeds are handed to feedparser as a stream of the undecoded bytes. Decoding them to a string first only for
+        # feedparser to encode them again would hold several copies of the feed in memory
         if is_url:
-            response = self._session.get(url, timeout=self._request_timeout)
-            feed_input = response.text
+            # When the feed has been fetched before, only ask the server for it if it has changed since
+            cached_feed = self._cached_feeds.get(url)
+            request_headers = cached_feed.validators if cached_feed is not None else None
+
+            session = self._acquire_session()
+            try:
+                response = session.get(url, timeout=self._request_timeout, headers=request_headers)
+            finally:
+                self._idle_sessions.put(session)
+
             if self._enable_cache:
                 cache_hit = response.from_cache
-        else:
-            feed_input = url
 
-        feed = feedparser.parse(feed_input)
+            # Servers which don't support conditional requests respond with the full feed, compare it to the previous
+            # response prior to parsing it again
+            body_hash = hash(response.content)
+            if (cached_feed is not None and (response.status_code == 304 or body_hash == cached_feed.body_hash)):
+                logger.debug("Feed unchanged: %s. Cache hit: %s", url, cache_hit)
+                return cached_feed.feed
+
+            feed = feedparser.parse(io.BytesIO(response.content), **self._parse_kwargs)
+        else:
+            with open(url, 'rb') as feed_file:
+                feed = feedparser.parse(feed_file, **self._parse_kwargs)
 
         if feed["bozo"]:
             fallback = True
             try:
-                if not is_url:
+                if is_url:
+                    feed_input = response.text
+                else:
                     # Read file content
-                    feed_input = self._read_file_content(feed_input)
+                    feed_input = self._read_file_content(url)
                 # Parse feed content with beautifulsoup
                 feed = self._try_parse_feed_with_beautiful_soup(feed_input)
             except Exception:
                 logger.error("Failed to parse the feed manually: %s", url)
                 raise
 
+        if is_url:
+            validators = {}
+            etag = response.headers.get("ETag")
+            if etag:
+                validators["If-None-Match"] = etag
+
+            last_modified = response.headers.get("Last-Modified")
+            if last_modified:
+                validators["If-Modified-Since"] = last_modified
+
+            self._cached_feeds[url] = _CachedFeed(body_hash=body_hash, validators=validators, feed=feed)
+
         logger.debug("Parsed feed: %s. Cache hit: %s. Fallback: %s", url, cache_hit, fallback)
 
         return feed
@@ -325,12 +421,28 @@ class RSSController:
         feedparser.FeedParserDict
             The parsed feed content.
         """
-        for url in self._feed_input:
-            feed_stats: FeedStats = self._feed_stats_dict[url]
-            current_time = time.time()
-            try:
-                if ((current_time - feed_stats.last_failure) >= self._cooldown_interval):
-                    feed = self._try_parse_feed(url)
+        current_time = time.time()
+
+        # Skip any feeds which failed recently until their cooldown interval has elapsed
+        feed_urls = [
+            url for url in self._feed_input
+            if ((current_time - self._feed_stats_dict[url].last_failure) >= self._cooldown_interval)
+        ]
+
+        if (len(feed_urls) == 0):
+            return
+
+        # Fetching a feed is mostly spent waiting on the network, fetch the feeds concurrently. The feeds are yielded in
+        # the order of `feed_input` rather than as they complete, keeping the order of the output entries, and which of
+        # any duplicate entries is kept, deterministic.
+        with ThreadPoolExecutor(max_workers=min(len(feed_urls), self.MAX_FETCH_WORKERS),
+                                thread_name_prefix="RSSController") as executor:
+            futures = [executor.submit(self._try_parse_feed, url) for url in feed_urls]
+
+            for (url, future) in zip(feed_urls, futures):
+                feed_stats: FeedStats = self._feed_stats_dict[url]
+                try:
+                    feed = future.result()
 
                     feed_stats.last_success = current_time
                     feed_stats.success_count += 1
@@ -338,13 +450,53 @@ class RSSController:
 
                     yield feed
 
-            except Exception as ex:
-                logger.warning("Failed to parse feed: %s Feed stats: %s\n%s.", url, asdict(feed_stats), ex)
-                feed_stats.last_failure = current_time
-                feed_stats.failure_count += 1
-                feed_stats.last_try_result = "Failure"
+                except Exception as ex:
+                    logger.warning("Failed to parse feed: %s Feed stats: %s\n%s.", url, asdict(feed_stats), ex)
+                    feed_stats.last_failure = current_time
+                    feed_stats.failure_count += 1
+                    feed_stats.last_try_result = "Failure"
 
-            logger.debug("Feed stats: %s", asdict(feed_stats))
+                logger.debug("Feed stats: %s", asdict(feed_stats))
+
+    @staticmethod
+    def _entries_to_columns(entries: list["feedparser.FeedParserDict"]) -> dict[str, list]:
+        """
+        Transpose the feed entries into a list of values for each field. Columns are ordered by the first appearance of
+        each field, and entries missing a field are given a value of `None`.
+        """
+        columns: dict[str, list] = {}
+        for (row_idx, entry) in enumerate(entries):
+            for (field, value) in entry.items():
+                column = columns.get(field)
+                if column is None:
+                    column = [None] * row_idx
+                    columns[field] = column
+
+                column.append(value)
+
+            for column in columns.values():
+                if len(column) == row_idx:
+                    column.append(None)
+
+        return columns
+
+    @staticmethod
+    def _entry_fingerprint(entry: "feedparser.FeedParserDict") -> int:
+        entry_id = entry.get('id')
+        if entry_id is None:
+            # Without a synthesized key every entry lacking an id would share the same fingerprint, and all of them
+            # would be treated as previously seen after the first fetch
+            return hash((entry.get('link'), entry.get('title'), entry.get('published')))
+
+        return hash(entry_id)
+
+    def _create_dataframe(self, entries: list["feedparser.FeedParserDict"]) -> DataFrameType:
+        if self._is_cudf:
+            # cuDF builds a DataFrame from a list of records by first constructing a pandas DataFrame, building it from
+            # columns allows each one to be converted directly to an Arrow array and copied to the device
+            return self._df_class(self._entries_to_columns(entries))
+
+        return self._df_class(entries)
 
     def fetch_dataframes(self):
         """
@@ -367,24 +519,25 @@ class RSSController:
 
             for feed in self.parse_feeds():
 
-                for entry in feed.entries:
-                    entry_id = entry.get('id')
-                    current_entries.add(entry_id)
-                    if entry_id not in self._previous_entries:
+                entry_fingerprints = [self._entry_fingerprint(entry) for entry in feed.entries]
+                current_entries.update(entry_fingerprints)
+
+                for (entry, entry_fingerprint) in zip(feed.entries, entry_fingerprints):
+                    if entry_fingerprint not in self._previous_entries:
                         if self._strip_markup:
                             self._strip_markup_from_fields(entry)
 
                         entry_accumulator.append(entry)
 
                         if self._batch_size > 0 and len(entry_accumulator) >= self._batch_size:
-                            yield self._df_class(entry_accumulator)
+                            yield self._create_dataframe(entry_accumulator)
                             entry_accumulator.clear()
 
             self._previous_entries = current_entries
 
             # Yield any remaining entries.
             if entry_accumulator:
-                yield self._df_class(entry_accumulator)
+                yield self._create_dataframe(entry_accumulator)
             else:
                 logger.debug("No new entries found.")
 
@@ -408,9 +561,8 @@ class RSSController:
             True if the url is a valid URL, False otherwise.
         """
         try:
-            parsed_url = urlparse(feed_input)
-            return parsed_url.scheme != '' and parsed_url.netloc != ''
-        except Exception:
+            return cls._URL_RE.match(feed_input) is not None
+        except TypeError:
             return False
 
     def feed_generator(self, subscription: mrc.Subscription) -> Iterable[MessageMeta]:
@@ -61,6 +61,10 @@ class TensorMemory(MessageData, cpp_class=_messages.TensorMemory):
                 f"The number rows in tensor {tensor.shape[0]} does not match {class_name}.count of {self.count}")
 
     def __getattr__(self, name: str) -> typing.Any:
+        # Special attributes are frequently probed for by copy, pickle and array libraries and are never tensors
+        if (name.startswith("__")):
+            raise AttributeError(name)
+
         if ("tensors" in self.__dict__ and self.has_tensor(name)):
             return self.get_tensor(name)
 
@@ -203,16 +203,15 @@ class MessageMeta(MessageBase, cpp_class=_messages.MessageMeta):
 
         """
 
-        idx = self._df.index[mess_offset:mess_offset + message_count]
-
-        if (isinstance(idx, pd.RangeIndex)):
-            idx = slice(idx.start, idx.stop - 1, idx.step)
+        # Select the rows by position, avoiding materializing the labels of the index for the range of rows and
+        # then looking them up again. This also returns the correct rows when the index contains duplicates.
+        rows = self._df.iloc[mess_offset:mess_offset + message_count]
 
         if (columns is None):
-            return self._df.loc[idx, :]
+            return rows
 
         # If its a str or list, this is the same
-        return self._df.loc[idx, columns]
+        return rows[columns]
 
     @typing.overload
     def get_data(self) -> DataFrameType:
@@ -317,13 +316,13 @@ class MessageMeta(MessageBase, cpp_class=_messages.MessageMeta):
         with self.mutable_dataframe() as df:
             return MessageMeta(df.iloc[start:stop])
 
-    def _ranges_to_mask(self, df, ranges):
-        mask = np.zeros(len(df), bool)
-
-        for range_ in ranges:
-            mask[range_[0]:range_[1]] = True
+    def _ranges_to_indices(self, ranges):
+        # Gathering the rows by position avoids building a boolean mask over every row of the DataFrame, which cuDF
+        # would need to copy to the device and compact
+        if (len(ranges) == 0):
+            return np.empty(0, dtype=np.int64)
 
-        return mask
+        return np.concatenate([np.arange(range_[0], range_[1], dtype=np.int64) for range_ in ranges])
 
     def copy_ranges(self, ranges: typing.List[typing.Tuple[int, int]]):
         """
@@ -342,8 +341,8 @@ class MessageMeta(MessageBase, cpp_class=_messages.MessageMeta):
         """
 
         with self.mutable_dataframe() as df:
-            mask = self._ranges_to_mask(df, ranges=ranges)
-            return MessageMeta(df.loc[mask, :])
+            indices = self._ranges_to_indices(ranges=ranges)
+            return MessageMeta(df.take(indices))
 
 
 @dataclasses.dataclass(init=False)
@@ -166,19 +166,12 @@ def file_batcher(builder: mrc.Builder):
             logger.error("Error parsing parameters: %s", (exec_info))
             raise
 
-        timestamps = []
-        full_names = []
+        timestamps = [date_extractor(file_object, iso_date_regex) for file_object in file_objects]
+        full_names = [file_object.full_name for file_object in file_objects]
 
-        for file_object in file_objects:
-            time_stamp = date_extractor(file_object, iso_date_regex)
-
-            # Exclude any files outside the time window
-            if ((start_time is not None and time_stamp < start_time)
-                    or (end_time is not None and time_stamp > end_time)):
-                continue
-
-            timestamps.append(time_stamp)
-            full_names.append(file_object.full_name)
+        # Early exit if no files were found, an empty DatetimeIndex can't be compared against the time window
+        if (len(timestamps) == 0):
+            return []
 
         # Build the dataframe
         df = pd.DataFrame(index=pd.DatetimeIndex(timestamps), data={"filename": full_names})
@@ -186,6 +179,11 @@ def file_batcher(builder: mrc.Builder):
         # sort the incoming data by date
         df.sort_index(inplace=True)
 
+        # Exclude any files outside the time window, slicing the sorted index is a binary search for each bound
+        # rather than a comparison per file. Both bounds are inclusive.
+        if (start_time is not None or end_time is not None):
+            df = df.loc[start_time:end_time]
+
         # If sampling was provided, perform that here
         if (sampling is not None):
 
@@ -209,20 +207,13 @@ def file_batcher(builder: mrc.Builder):
             # No period was set so group them all into one single batch
             return [(df["filename"].to_list(), len(df))]
 
-        # Now group the rows by the period
-        resampled = df.resample(period)
-
-        n_groups = len(resampled)
-
-        output_batches = []
-
-        for _, period_df in resampled:
-
-            filename_list = period_df["filename"].to_list()
+        # Now group the rows by the period, collecting each period's filenames in a single aggregation rather than
+        # materializing a DataFrame per period. Empty periods are kept as empty lists so they count towards n_groups.
+        period_filenames = df.resample(period)["filename"].agg(list).to_list()
 
-            output_batches.append((filename_list, n_groups))
+        n_groups = len(period_filenames)
 
-        return output_batches
+        return [(filename_list, n_groups) for filename_list in period_filenames]
 
     def build_file_df_params(control_message: ControlMessage) -> typing.Dict[any, any]:
         file_to_df_opts = {}
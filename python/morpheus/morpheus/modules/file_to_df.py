@@ -13,6 +13,7 @@
 # limitations under the License.
 """Morpheus pipeline module for fetching files and emitting them as DataFrames."""
 
+import functools
 import logging
 import pickle
 
@@ -28,6 +29,13 @@ from morpheus.utils.module_utils import register_module
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_schema(schema_str: str, encoding: str):
+    # Module replicas sharing a config receive the same pickled schema, only unpickle it once. The schema is treated as
+    # read-only after construction so sharing the instance is safe.
+    return pickle.loads(bytes(schema_str, encoding))
+
+
 @register_module(FILE_TO_DF, MORPHEUS_MODULE_NAMESPACE)
 def file_to_df(builder: mrc.Builder):
     """
@@ -71,7 +79,7 @@ def file_to_df(builder: mrc.Builder):
         logger.warning("Cache directory not set. Defaulting to ./.cache")
 
     # Load input schema
-    schema = pickle.loads(bytes(schema_str, encoding))
+    schema = _load_schema(schema_str, encoding)
 
     try:
         file_type = str_to_file_type(file_type.lower())
@@ -41,8 +41,10 @@ def _rss_source(builder: mrc.Builder):
     ---------------------
     {
         "batch_size": 32,
+        "cache_backend": "sqlite",
         "cache_dir": "./.cache/http",
         "cooldown_interval_sec": 600,
+        "df_type": "cudf",
         "enable_cache": True,
         "feed_input": ["https://nvidianews.nvidia.com/releases.xml"],
         "interval_sec": 600,
@@ -71,11 +73,13 @@ def _rss_source(builder: mrc.Builder):
                                batch_size=validated_config.batch_size,
                                enable_cache=validated_config.enable_cache,
                                cache_dir=validated_config.cache_dir,
+                               cache_backend=validated_config.cache_backend,
                                cooldown_interval=validated_config.cooldown_interval_sec,
                                request_timeout=validated_config.request_timeout_sec,
                                strip_markup=validated_config.strip_markup,
                                stop_after=validated_config.stop_after_rec,
-                               interval_secs=validated_config.interval_sec)
+                               interval_secs=validated_config.interval_sec,
+                               df_type=validated_config.df_type)
 
     node = builder.make_source("fetch_feeds", controller.feed_generator)
 
@@ -98,16 +98,16 @@ def _process_dataframe_to_control_message(message: MessageMeta,
 
     # Now break it up by batches
     output = []
+    count = message.count
 
-    if (message.count > batch_size):
-        df = message.copy_dataframe()
-
-        # Break the message meta into smaller chunks
-        for i in range(0, message.count, batch_size):
+    if (count > batch_size):
+        # Break the message meta into smaller chunks. Each slice only copies its own rows (with the C++ impl the copy
+        # happens without holding the GIL), rather than deep copying the entire DataFrame up front and then slicing it
+        for i in range(0, count, batch_size):
 
             ctrl_msg = ControlMessage()
 
-            ctrl_msg.payload(MessageMeta(df=df.iloc[i:i + batch_size]))
+            ctrl_msg.payload(message.get_slice(i, min(i + batch_size, count)))
 
             if (task_tuple is not None):
                 ctrl_msg.add_task(task_type=task_tuple[0], task=task_tuple[1])
@@ -116,7 +116,8 @@ def _process_dataframe_to_control_message(message: MessageMeta,
     else:
         ctrl_msg = ControlMessage()
 
-        ctrl_msg.payload(MessageMeta(message.df))
+        # The message fits in a single batch, use it as the payload as-is. The `df` property would return a deep copy
+        ctrl_msg.payload(message)
 
         if (task_tuple is not None):
             ctrl_msg.add_task(task_type=task_tuple[0], task=task_tuple[1])
@@ -19,6 +19,8 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 
+from morpheus.utils.type_aliases import DataFrameModule
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,9 +30,11 @@ class RSSSourceSchema(BaseModel):
     batch_size: int = 128
     enable_cache: bool = False
     cache_dir: str = "./.cache/http"
+    cache_backend: str = "sqlite"
     cooldown_interval_sec: int = 600
     request_timeout_sec: float = 2.0
     interval_sec: int = 600
     stop_after_rec: int = 0
     strip_markup: bool = True
+    df_type: DataFrameModule = "cudf"
     model_config = ConfigDict(extra='forbid')
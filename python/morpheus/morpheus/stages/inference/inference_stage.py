@@ -326,14 +326,20 @@ class InferenceStage(ControlMessageStage):
 
         out_resp = []
 
+        # Fetch the tensors once, when C++ execution is enabled each call to `get_tensors` returns a new Python copy of
+        # the tensors stored in the C++ object
+        tensors = msg.tensors().get_tensors()
+
         for start, stop in out_batches:
             out_msg = ControlMessage(msg)
 
             out_msg.payload(msg.payload().get_slice(start, stop))
 
-            out_msg_tensors = TensorMemory(count=stop - start, tensors={})
-            for (name, tensor) in msg.tensors().get_tensors().items():
-                out_msg_tensors.set_tensor(name, tensor[start:stop])
+            out_msg_tensors = TensorMemory(count=stop - start,
+                                           tensors={
+                                               name: tensor[start:stop]
+                                               for (name, tensor) in tensors.items()
+                                           })
             out_msg.tensors(out_msg_tensors)
 
             out_resp.append(out_msg)
@@ -355,8 +361,9 @@ class InferenceStage(ControlMessageStage):
 
         seq_ids = inf.tensors().get_tensor("seq_ids")
 
-        seq_offset = seq_ids[0, 0].item()
-        seq_count = seq_ids[-1, 0].item() + 1 - seq_offset
+        # Fetch the first and last sequence ids together, each `.item()` call is a separate copy from the device
+        (seq_offset, seq_last) = seq_ids[[0, -1], 0].tolist()
+        seq_count = seq_last + 1 - seq_offset
 
         # Two scenarios:
         if (inf.payload().count == inf.tensor_count()):
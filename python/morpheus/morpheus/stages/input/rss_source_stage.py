@@ -49,6 +49,8 @@ class RSSSourceStage(GpuAndCpuMixin, PreallocatorMixin, SingleOutputSource):
         Enable caching of RSS feed request data.
     cache_dir : str, optional, default = "./.cache/http"
         Cache directory for storing RSS feed request data.
+    cache_backend : str, optional, default = "sqlite"
+        The `requests_cache` backend used when caching is enabled, such as "sqlite", "filesystem" or "redis".
     cooldown_interval : int, optional, default = 600
          Cooldown interval in seconds if there is a failure in fetching or parsing the feed.
     request_timeout : float, optional, default = 2.0
@@ -66,6 +68,7 @@ class RSSSourceStage(GpuAndCpuMixin, PreallocatorMixin, SingleOutputSource):
                  batch_size: int = 32,
                  enable_cache: bool = False,
                  cache_dir: str = "./.cache/http",
+                 cache_backend: str = "sqlite",
                  cooldown_interval: int = 600,
                  request_timeout: float = 2.0,
                  strip_markup: bool = False):
@@ -78,6 +81,7 @@ class RSSSourceStage(GpuAndCpuMixin, PreallocatorMixin, SingleOutputSource):
                                          run_indefinitely=run_indefinitely,
                                          enable_cache=enable_cache,
                                          cache_dir=cache_dir,
+                                         cache_backend=cache_backend,
                                          cooldown_interval=cooldown_interval,
                                          request_timeout=request_timeout,
                                          strip_markup=strip_markup,
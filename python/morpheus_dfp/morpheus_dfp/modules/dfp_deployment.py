@@ -21,7 +21,6 @@ from morpheus.messages import ControlMessage
 from morpheus.utils.loader_ids import FSSPEC_LOADER
 from morpheus.utils.module_ids import DATA_LOADER
 from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
-from morpheus.utils.module_utils import merge_dictionaries
 from morpheus.utils.module_utils import register_module
 from morpheus_dfp.utils.module_ids import DFP_DEPLOYMENT
 from morpheus_dfp.utils.module_ids import DFP_INFERENCE_PIPE
@@ -29,6 +28,16 @@ from morpheus_dfp.utils.module_ids import DFP_TRAINING_PIPE
 
 logger = logging.getLogger(f"morpheus.{__name__}")
 
+TRAINING_OUTPUT_PORT = "output_0"
+INFERENCE_OUTPUT_PORT = "output_1"
+
+# The fsspec data loader configuration does not depend on the module config, build it once at import time
+FSSPEC_DATALOADER_CONF = {
+    "loaders": [{
+        "id": FSSPEC_LOADER
+    }],
+}
+
 
 @register_module(DFP_DEPLOYMENT, MORPHEUS_MODULE_NAMESPACE)
 def dfp_deployment(builder: mrc.Builder):
@@ -182,21 +191,15 @@ def dfp_deployment(builder: mrc.Builder):
 
     module_config = builder.get_current_module_config()
 
-    num_output_ports = 2
-
-    supported_loaders = {}
-    fsspec_loader_defaults = {
-        "loaders": [{
-            "id": FSSPEC_LOADER
-        }],
-    }
-
-    fsspec_dataloader_conf = merge_dictionaries(supported_loaders, fsspec_loader_defaults)
+    # Validate the required options before any of the child modules are loaded
+    for required_key in ("training_options", "inference_options"):
+        if required_key not in module_config:
+            raise KeyError(f"'{required_key}' is not set in the '{DFP_DEPLOYMENT}' module configuration.")
 
     dfp_training_pipe_conf = module_config["training_options"]
     dfp_inference_pipe_conf = module_config["inference_options"]
 
-    fsspec_dataloader_module = builder.load_module(DATA_LOADER, "morpheus", "fsspec_dataloader", fsspec_dataloader_conf)
+    fsspec_dataloader_module = builder.load_module(DATA_LOADER, "morpheus", "fsspec_dataloader", FSSPEC_DATALOADER_CONF)
     dfp_training_pipe_module = builder.load_module(DFP_TRAINING_PIPE,
                                                    "morpheus",
                                                    "dfp_training_pipe",
@@ -222,12 +225,9 @@ def dfp_deployment(builder: mrc.Builder):
     builder.make_edge(router.get_source("training"), dfp_training_pipe_module.input_port("input"))
     builder.make_edge(router.get_source("inference"), dfp_inference_pipe_module.input_port("input"))
 
-    out_nodes = [dfp_training_pipe_module.output_port("output"), dfp_inference_pipe_module.output_port("output")]
-
     # Register input port for a module.
     builder.register_module_input("input", fsspec_dataloader_module.input_port("input"))
 
-    # Register output ports for a module.
-    for i in range(num_output_ports):
-        # Output ports are registered in increment order.
-        builder.register_module_output(f"output_{i}", out_nodes[i])
+    # Register output ports for a module. The training pipe is always output_0 and the inference pipe output_1.
+    builder.register_module_output(TRAINING_OUTPUT_PORT, dfp_training_pipe_module.output_port("output"))
+    builder.register_module_output(INFERENCE_OUTPUT_PORT, dfp_inference_pipe_module.output_port("output"))
@@ -95,7 +95,7 @@ def dfp_preproc(builder: mrc.Builder):
 
     splitting_opts = config.get("user_splitting_options", {})
     splitting_opts["cache_dir"] = cache_dir
-    splitting_opts["timestamp_col_name"] = ts_column_name
+    splitting_opts["timestamp_column_name"] = ts_column_name
 
     supported_loaders = config.get("supported_loaders", {})
 
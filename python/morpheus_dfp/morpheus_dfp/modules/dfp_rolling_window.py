@@ -15,19 +15,23 @@
 import logging
 import os
 import typing
+import zlib
+from concurrent.futures import Future
 from contextlib import contextmanager
 
 import mrc
-import pandas as pd
+import numpy as np
 from mrc.core import operators as ops
-
-import cudf
+from mrc.core.node import Router
 
 from morpheus.messages import ControlMessage
 from morpheus.messages import MessageMeta
+from morpheus.utils.atomic_integer import AtomicInteger
 from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
 from morpheus.utils.module_utils import register_module
+from morpheus.utils.type_aliases import DataFrameType
 from morpheus_dfp.utils.cached_user_window import CachedUserWindow
+from morpheus_dfp.utils.cached_user_window import CachedUserWindowStore
 from morpheus_dfp.utils.logging_timer import log_time
 from morpheus_dfp.utils.module_ids import DFP_ROLLING_WINDOW
 
@@ -58,6 +62,21 @@ def dfp_rolling_window(builder: mrc.Builder):
           Default: '60d'
         - cache_to_disk (bool): Whether to cache streaming data to disk; Example: false; Default: false
         - cache_dir (str): Directory to use for caching streaming data; Example: './.cache'; Default: './.cache'
+        - cache_flush_interval (int): Number of users with pending changes to accumulate before writing their caches to
+          disk, pending changes are always written when the pipeline completes. Only used when `cache_to_disk` is
+          true; Example: 100; Default: 1
+        - num_user_shards (int): Number of nodes to process users in parallel, messages are partitioned across the
+          nodes by a hash of the `user_id` so that each user's window is only ever accessed by a single node;
+          Example: 4; Default: 1
+        - on_full_behavior (str): Behavior when the rolling window falls behind the incoming messages. Setting to
+          `block` applies backpressure to upstream modules, while `drop_newest` discards incoming messages once
+          `buffer_size` messages are pending; Example: 'drop_newest'; Default: 'block'
+        - buffer_size (int): Maximum number of pending messages before incoming messages are discarded. Only used
+          when `on_full_behavior` is `drop_newest`. The pending messages are held by the edge feeding the rolling
+          window, so this must be smaller than `edge_buffer_size`, otherwise the edge fills first and upstream modules
+          are blocked as with `block`; Example: 32; Default: 64
+        - edge_buffer_size (int): Size of the edges in the pipeline, should match `Config.edge_buffer_size`. Only used
+          to validate `buffer_size`; Example: 128; Default: 128
     """
 
     config = builder.get_current_module_config()
@@ -76,116 +95,256 @@ def dfp_rolling_window(builder: mrc.Builder):
         logger.warning("No cache directory specified, using default: %s", cache_dir)
 
     cache_dir = os.path.join(cache_dir, "rolling-user-data")
+    cache_flush_interval = config.get("cache_flush_interval", 1)
 
-    user_cache_map: typing.Dict[str, CachedUserWindow] = {}
+    # The windows for all users are persisted to a single database, allowing many users to be saved at once
+    cache_store = CachedUserWindowStore(os.path.join(cache_dir, "user_windows.db")) if cache_to_disk else None
 
-    @contextmanager
-    def get_user_cache(user_id: str):
-        # Determine cache location
-        cache_location = os.path.join(cache_dir, f"{user_id}.pkl") if cache_to_disk else None
+    num_user_shards = config.get("num_user_shards", 1)
+    if (num_user_shards < 1):
+        raise ValueError(f"num_user_shards must be at least 1, got {num_user_shards}")
 
-        user_cache = user_cache_map.get(user_id, None)
+    remaining_shards = AtomicInteger(num_user_shards)
 
-        if (user_cache is None):
-            user_cache = CachedUserWindow(user_id=user_id,
-                                          cache_location=cache_location,
-                                          timestamp_column=timestamp_column_name)
+    buffer_size = config.get("buffer_size", 64)
+    on_full_behavior = config.get("on_full_behavior", "block")
+    if (on_full_behavior not in ("block", "drop_newest")):
+        raise ValueError(f"on_full_behavior must be one of 'block' or 'drop_newest', got '{on_full_behavior}'")
 
-            user_cache_map[user_id] = user_cache
+    drop_when_full = on_full_behavior == "drop_newest"
 
-        yield user_cache
+    edge_buffer_size = config.get("edge_buffer_size", 128)
+    if (drop_when_full and buffer_size >= edge_buffer_size):
+        raise ValueError(f"buffer_size ({buffer_size}) must be smaller than edge_buffer_size ({edge_buffer_size}) "
+                         "when on_full_behavior is 'drop_newest', otherwise no messages are ever dropped")
 
-    def try_build_window(message: MessageMeta, user_id: str) -> typing.Union[MessageMeta, None]:
-        with get_user_cache(user_id) as user_cache:
+    # Messages which have been admitted but not yet processed by the rolling window, along with the number dropped
+    pending_messages = AtomicInteger(0)
+    dropped_messages = AtomicInteger(0)
 
-            with message.mutable_dataframe() as dfm:
-                incoming_df = dfm.to_pandas()
+    def admit_message() -> bool:
+        if (pending_messages.value >= buffer_size):
+            logger.warning("Rolling window has %d pending messages, dropping message. Total dropped messages: %d",
+                           pending_messages.value,
+                           dropped_messages.inc())
+            return False
 
-            if (not user_cache.append_dataframe(incoming_df=incoming_df)):
-                # Then our incoming dataframe wasn't even covered by the window. Generate warning
-                logger.warning(("Incoming data preceeded existing history. "
-                                "Consider deleting the rolling window cache and restarting."))
-                return None
+        pending_messages.inc()
 
-            if (cache_to_disk and cache_dir is not None):
-                logger.debug("Saved rolling window cache for %s == %d items", user_id, user_cache.total_count)
-                user_cache.save()
+        return True
 
-            # Exit early if we don't have enough data
-            if (user_cache.count < min_history):
-                logger.debug("Not enough data to train")
-                return None
+    def buffer_node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
+
+        # Discard messages inline rather than with a separate filter operator
+        def on_next(control_message: ControlMessage):
+            if (admit_message()):
+                sub.on_next(control_message)
+
+        obs.subscribe(mrc.Observer.make_observer(on_next, sub.on_error, sub.on_completed))
+
+    def count_incoming_rows(df_window: DataFrameType, first_hash: int, last_hash: int, incoming_count: int) -> int:
+        row_hashes = df_window["_row_hash"]
+        window_count = len(row_hashes)
+
+        # The incoming rows were just appended to the window, so for a valid window they are the trailing rows. Check
+        # just those two positions before falling back to scanning the entire hash column.
+        if (window_count >= incoming_count and row_hashes.iloc[window_count - incoming_count] == first_hash
+                and row_hashes.iloc[-1] == last_hash):
+            return incoming_count
+
+        # Find the index of the first and last row, only the hash column is filtered rather than the entire window
+        first_matches = row_hashes[row_hashes == first_hash]
+
+        if (len(first_matches) == 0):
+            raise RuntimeError("Invalid rolling window")
+
+        first_row_idx = first_matches.index[0].item()
+        last_row_idx = row_hashes[row_hashes == last_hash].index[-1].item()
+
+        return (last_row_idx - first_row_idx) + 1
+
+    def on_save_completed(save_future: Future):
+        if (save_future.exception() is not None):
+            logger.error("Error saving rolling window cache to %s: %s", cache_store.db_path, save_future.exception())
+
+    def make_shard_node(shard_name: str) -> mrc.SegmentObject:
+        # Each shard owns the windows for a disjoint set of users, so shards never share per-user state
+        user_cache_map: typing.Dict[str, CachedUserWindow] = {}
+
+        # Users whose cache has changed since it was last written to disk
+        pending_save_user_ids: typing.Set[str] = set()
+
+        @contextmanager
+        def get_user_cache(user_id: str):
+            user_cache = user_cache_map.get(user_id, None)
+
+            if (user_cache is None):
+                # Persisting to disk is handled by the cache_store, so the window doesn't need its own cache location
+                user_cache = CachedUserWindow(user_id=user_id,
+                                              cache_location=None,
+                                              timestamp_column=timestamp_column_name)
+
+                user_cache_map[user_id] = user_cache
+
+            yield user_cache
+
+        def save_pending_caches():
+            # The windows are written on a background thread, overlapping the disk I/O with processing the next message
+            save_future = cache_store.save_async(user_cache_map[user_id] for user_id in pending_save_user_ids)
+            save_future.add_done_callback(on_save_completed)
+
+            logger.debug("Saving rolling window cache for %d users to %s",
+                         len(pending_save_user_ids),
+                         cache_store.db_path)
 
-            if (cache_mode == "batch"):
-                df_window = user_cache.get_spanning_df(max_history=None)
-                user_cache.flush()
-            else:
-                # We have enough data, but has enough time since the last training taken place?
-                if (user_cache.total_count - user_cache.last_train_count < min_increment):
-                    logger.debug("Elapsed time since last train is too short")
+            pending_save_user_ids.clear()
+
+        def try_build_window(message: MessageMeta,
+                             user_id: str,
+                             boundary_hashes: tuple[int, int] | None) -> typing.Union[MessageMeta, None]:
+            with get_user_cache(user_id) as user_cache:
+
+                # Keep the incoming data in its original DataFrame type, for cuDF this keeps the window on the GPU
+                incoming_df = message.get_data()
+
+                if (not user_cache.append_dataframe(incoming_df=incoming_df)):
+                    # Then our incoming dataframe wasn't even covered by the window. Generate warning
+                    logger.warning(("Incoming data preceeded existing history. "
+                                    "Consider deleting the rolling window cache and restarting."))
+                    return None
+
+                if (cache_store is not None):
+                    # Batch the writes to disk across multiple users
+                    pending_save_user_ids.add(user_id)
+                    if (len(pending_save_user_ids) >= cache_flush_interval):
+                        save_pending_caches()
+
+                # Exit early if we don't have enough data
+                if (user_cache.count < min_history):
+                    logger.debug("Not enough data to train")
                     return None
 
-                # Obtain a dataframe spanning the aggregation window
-                df_window = user_cache.get_spanning_df(max_history=aggregation_span)
+                if (cache_mode == "batch"):
+                    df_window = user_cache.get_spanning_df(max_history=None)
+                    user_cache.flush()
+                else:
+                    # We have enough data, but has enough time since the last training taken place?
+                    if (user_cache.total_count - user_cache.last_train_count < min_increment):
+                        logger.debug("Elapsed time since last train is too short")
+                        return None
+
+                    # Obtain a dataframe spanning the aggregation window
+                    df_window = user_cache.get_spanning_df(max_history=aggregation_span)
+
+                    # Use the hashes of the incoming boundary rows computed upstream, otherwise hash them here
+                    if (boundary_hashes is None):
+                        boundary_hashes = CachedUserWindow.hash_boundary_rows(incoming_df)
+
+                    first_hash, last_hash = np.array(boundary_hashes, dtype=np.int64).view(np.uint64)
+
+                    found_count = count_incoming_rows(df_window, first_hash, last_hash, len(incoming_df))
 
-                # Hash the incoming data rows to find a match
-                incoming_hash = pd.util.hash_pandas_object(incoming_df.iloc[[0, -1]], index=False)
+                    if (found_count != len(incoming_df)):
+                        raise RuntimeError(("Overlapping rolling history detected. "
+                                            "Rolling history can only be used with non-overlapping batches"))
 
-                # Find the index of the first and last row
-                match = df_window[df_window["_row_hash"] == incoming_hash.iloc[0]]
+                return MessageMeta(df_window)
 
-                if (len(match) == 0):
-                    raise RuntimeError("Invalid rolling window")
+        def on_data(control_message: ControlMessage):
 
-                first_row_idx = match.index[0].item()
-                last_row_idx = df_window[df_window["_row_hash"] == incoming_hash.iloc[-1]].index[-1].item()
+            try:
+                payload = control_message.payload()
+                user_id = control_message.get_metadata("user_id")
+
+                if (control_message.has_metadata("data_type")):
+                    data_type = control_message.get_metadata("data_type")
+                else:
+                    data_type = "streaming"
+
+                # If we're an explicit training or inference task, then we don't need to do any rolling window logic
+                if (data_type == "payload"):
+                    return control_message
+
+                if (data_type == "streaming"):
+                    if (control_message.has_metadata("first_row_hash")):
+                        boundary_hashes = (control_message.get_metadata("first_row_hash"),
+                                           control_message.get_metadata("last_row_hash"))
+                    else:
+                        boundary_hashes = None
+
+                    with log_time(logger.debug):
+                        result = try_build_window(payload, user_id, boundary_hashes)  # Return a MessageMeta
+
+                        if (result is None):
+                            return result
+
+                    control_message.payload(result)
+                    control_message.set_metadata("data_type", "payload")
+
+                    return control_message
+
+                raise RuntimeError(f"Unknown data type: {data_type}")
+
+            except Exception as exec_info:
+                logger.error("Error processing control message in rolling window: %s\nDiscarding control message.",
+                             exec_info)
+                return None
 
-                found_count = (last_row_idx - first_row_idx) + 1
+        def on_completed():
+            if (len(pending_save_user_ids) > 0):
+                save_pending_caches()
 
-                if (found_count != len(incoming_df)):
-                    raise RuntimeError(("Overlapping rolling history detected. "
-                                        "Rolling history can only be used with non-overlapping batches"))
+            # The store is shared by all of the shards, only close it once the last shard has completed
+            if (cache_store is not None and remaining_shards.dec() == 0):
+                cache_store.close()
 
-            return MessageMeta(cudf.from_pandas(df_window))
+        def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
 
-    def on_data(control_message: ControlMessage):
+            # Discard messages inline rather than with a separate filter operator, avoiding an additional operator
+            # call for each message
+            def on_next(control_message: ControlMessage):
+                try:
+                    result = on_data(control_message)
+                finally:
+                    if (drop_when_full):
+                        pending_messages.dec()
 
-        try:
-            payload = control_message.payload()
-            user_id = control_message.get_metadata("user_id")
+                if (result is not None):
+                    sub.on_next(result)
 
-            if (control_message.has_metadata("data_type")):
-                data_type = control_message.get_metadata("data_type")
-            else:
-                data_type = "streaming"
+            def on_node_completed():
+                on_completed()
+                sub.on_completed()
 
-            # If we're an explicit training or inference task, then we don't need to do any rolling window logic
-            if (data_type == "payload"):
-                return control_message
+            obs.subscribe(mrc.Observer.make_observer(on_next, sub.on_error, on_node_completed))
 
-            if (data_type == "streaming"):
-                with log_time(logger.debug):
-                    result = try_build_window(payload, user_id)  # Return a MessageMeta
+        return builder.make_node(shard_name, mrc.core.operators.build(node_fn))
 
-                    if (result is None):
-                        return result
+    if (num_user_shards == 1):
+        input_node = output_node = make_shard_node(DFP_ROLLING_WINDOW)
+    else:
+        shard_keys = [f"shard_{i}" for i in range(num_user_shards)]
 
-                control_message.payload(result)
-                control_message.set_metadata("data_type", "payload")
+        def shard_key_fn(control_message: ControlMessage) -> str:
+            # Use a stable hash so that every message for a given user is always routed to the same shard
+            user_id = control_message.get_metadata("user_id") if control_message.has_metadata("user_id") else ""
+            return shard_keys[zlib.crc32(str(user_id).encode()) % num_user_shards]
 
-                return control_message
+        input_node = Router(builder, f"{DFP_ROLLING_WINDOW}-router", router_keys=shard_keys, key_fn=shard_key_fn)
+        output_node = builder.make_node(f"{DFP_ROLLING_WINDOW}-merge",
+                                        ops.map(lambda control_message: control_message))
 
-            raise RuntimeError(f"Unknown data type: {data_type}")
+        for shard_key in shard_keys:
+            shard_node = make_shard_node(f"{DFP_ROLLING_WINDOW}-{shard_key}")
 
-        except Exception as exec_info:
-            logger.error("Error processing control message in rolling window: %s\nDiscarding control message.",
-                         exec_info)
-            return None
+            builder.make_edge(input_node.get_source(shard_key), shard_node)
+            builder.make_edge(shard_node, output_node)
 
-    def node_fn(obs: mrc.Observable, sub: mrc.Subscriber):
-        obs.pipe(ops.map(on_data), ops.filter(lambda x: x is not None)).subscribe(sub)
+    if (drop_when_full):
+        buffer_node = builder.make_node(f"{DFP_ROLLING_WINDOW}-buffer", mrc.core.operators.build(buffer_node_fn))
 
-    node = builder.make_node(DFP_ROLLING_WINDOW, mrc.core.operators.build(node_fn))
+        builder.make_edge(buffer_node, input_node)
+        input_node = buffer_node
 
-    builder.register_module_input("input", node)
-    builder.register_module_output("output", node)
+    builder.register_module_input("input", input_node)
+    builder.register_module_output("output", output_node)
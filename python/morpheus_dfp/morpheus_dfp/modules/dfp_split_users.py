@@ -16,15 +16,16 @@ import logging
 import typing
 
 import mrc
-import pandas as pd
+import numpy as np
 from mrc.core import operators as ops
 
-import cudf
-
 from morpheus.messages import ControlMessage
 from morpheus.messages import MessageMeta
 from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
 from morpheus.utils.module_utils import register_module
+from morpheus.utils.type_aliases import DataFrameType
+from morpheus.utils.type_utils import is_cudf_type
+from morpheus_dfp.utils.cached_user_window import CachedUserWindow
 from morpheus_dfp.utils.logging_timer import log_time
 from morpheus_dfp.utils.module_ids import DFP_SPLIT_USERS
 
@@ -61,6 +62,13 @@ def dfp_split_users(builder: mrc.Builder):
     skip_users = config.get("skip_users", [])
     only_users = config.get("only_users", [])
 
+    # Resolve the user filters once, rather than for every message
+    skip_users_set = frozenset(skip_users)
+    has_skip_users = len(skip_users) > 0
+    has_only_users = len(only_users) > 0
+
+    # dfp_preproc always sets this key, passing None when the pipeline doesn't specify a timestamp column
+    timestamp_column_name = config.get("timestamp_column_name") or "timestamp"
     userid_column_name = config.get("userid_column_name", "username")
     include_generic = config.get("include_generic", False)
     include_individual = config.get("include_individual", False)
@@ -73,14 +81,17 @@ def dfp_split_users(builder: mrc.Builder):
     # Map of user ids to total number of messages. Keep indexes monotonic and increasing per user
     user_index_map: typing.Dict[str, int] = {}
 
-    def generate_control_messages(control_message: ControlMessage, split_dataframes: typing.Dict[str, cudf.DataFrame]):
+    def generate_control_messages(control_message: ControlMessage,
+                                  split_dataframes: typing.Dict[str, DataFrameType]):
         output_messages: typing.List[ControlMessage] = []
 
-        for user_id in sorted(split_dataframes.keys()):
-            if (user_id in skip_users):
-                continue
+        # Number of rows for each output message, kept in an array so the statistics don't need to convert a list
+        rows_per_user = np.empty(len(split_dataframes), dtype=np.int64)
 
-            user_df = split_dataframes[user_id]
+        # Users are emitted in the order they were split, sorting the user IDs for every batch isn't needed downstream
+        for user_id, user_df in split_dataframes.items():
+            if (user_id in skip_users_set):
+                continue
 
             current_user_count = user_index_map.get(user_id, 0)
 
@@ -88,37 +99,58 @@ def dfp_split_users(builder: mrc.Builder):
             user_df.index = range(current_user_count, current_user_count + len(user_df))
             user_index_map[user_id] = current_user_count + len(user_df)
 
+            rows_per_user[len(output_messages)] = len(user_df)
+
             user_control_message = control_message.copy()
             user_control_message.set_metadata("user_id", user_id)
 
-            user_cudf = cudf.from_pandas(user_df)
-            user_control_message.payload(MessageMeta(df=user_cudf))
+            # Hash the boundary rows while the data is at hand, sparing the rolling window from hashing them again. The
+            # generic user's DataFrame can be empty, in which case the rolling window falls back to hashing itself
+            if (len(user_df) > 0):
+                first_row_hash, last_row_hash = CachedUserWindow.hash_boundary_rows(user_df)
+                user_control_message.set_metadata("first_row_hash", first_row_hash)
+                user_control_message.set_metadata("last_row_hash", last_row_hash)
+
+            # The per-user DataFrames are the same type as the incoming DataFrame, no conversion needed
+            user_control_message.payload(MessageMeta(df=user_df))
 
             output_messages.append(user_control_message)
 
-        return output_messages
+        return output_messages, rows_per_user[:len(output_messages)]
 
-    def generate_split_dataframes(users_df: pd.DataFrame):
-        split_dataframes: typing.Dict[str, cudf.DataFrame] = {}
+    def generate_split_dataframes(users_df: DataFrameType):
+        split_dataframes: typing.Dict[str, DataFrameType] = {}
 
         # If we are skipping users, do that here
-        if (len(skip_users) > 0):
+        if (has_skip_users):
             users_df = users_df[~users_df[userid_column_name].isin(skip_users)]
 
-        if (len(only_users) > 0):
+        if (has_only_users):
             users_df = users_df[users_df[userid_column_name].isin(only_users)]
 
         # Split up the dataframes
         if (include_generic):
-            split_dataframes[fallback_username] = users_df
+            # Shallow copy, since the index is reset below and we don't want to modify the incoming DataFrame
+            split_dataframes[fallback_username] = users_df.copy(deep=False)
 
         if (include_individual):
-            # pylint: disable=unnecessary-comprehension
-            # List comprehension is necessary here to convert to a dictionary
-            split_dataframes.update({
-                username: user_df
-                for username, user_df in users_df.groupby(userid_column_name, sort=False)
-            })
+            if (is_cudf_type(users_df)):
+                # Partition every user in a single scatter rather than gathering each group one at a time. Rows
+                # without a user ID are dropped, matching the behavior of groupby
+                if (users_df[userid_column_name].hasnans):
+                    users_df = users_df[users_df[userid_column_name].notna()]
+
+                user_codes, user_ids = users_df[userid_column_name].factorize()
+                partitions = users_df.scatter_by_map(user_codes, map_size=len(user_ids))
+
+                split_dataframes.update(zip(user_ids.to_arrow().to_pylist(), partitions))
+            else:
+                # pylint: disable=unnecessary-comprehension
+                # List comprehension is necessary here to convert to a dictionary
+                split_dataframes.update({
+                    username: user_df
+                    for username, user_df in users_df.groupby(userid_column_name, sort=False)
+                })
 
         return split_dataframes
 
@@ -131,16 +163,29 @@ def dfp_split_users(builder: mrc.Builder):
             control_messages = None  # for readability
             message_meta = control_message.payload()
             with message_meta.mutable_dataframe() as dfm:
-                with log_time(logger.debug):
-
-                    if (isinstance(dfm, cudf.DataFrame)):
-                        # Convert to pandas because cudf is slow at this
-                        users_df = dfm.to_pandas()
+                with log_time(logger.debug) as log_info:
+                    # Perform the filtering and grouping on the incoming DataFrame directly, avoiding a round-trip
+                    # through host memory when the DataFrame is a cuDF DataFrame
+                    split_dataframes = generate_split_dataframes(dfm)
+
+                    control_messages, rows_per_user = generate_control_messages(control_message, split_dataframes)
+
+                    # The time range is only needed for the log message, avoid computing it (two reductions on the
+                    # device for cuDF) for every batch unless it will be logged
+                    if (len(control_messages) > 0 and logger.isEnabledFor(logging.DEBUG)):
+                        log_info.set_log(
+                            ("Batch split users complete. Input: %s rows from %s to %s. "
+                             "Output: %s users, rows/user min: %s, max: %s, avg: %.2f. Duration: {duration:.2f} ms"),
+                            len(dfm),
+                            dfm[timestamp_column_name].min(),
+                            dfm[timestamp_column_name].max(),
+                            len(rows_per_user),
+                            rows_per_user.min(),
+                            rows_per_user.max(),
+                            rows_per_user.mean(),
+                        )
                     else:
-                        users_df = dfm
-
-                    split_dataframes = generate_split_dataframes(users_df)
-                    control_messages = generate_control_messages(control_message, split_dataframes)
+                        log_info.disable()
 
             return control_messages
         except Exception as exec_info:
@@ -15,12 +15,15 @@
 import logging
 
 import mrc
+from mrc.core.node import Router
 
 from morpheus.modules.general.monitor import MonitorLoaderFactory
 from morpheus.utils.module_ids import MLFLOW_MODEL_WRITER
 from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
 from morpheus.utils.module_utils import merge_dictionaries
 from morpheus.utils.module_utils import register_module
+from morpheus_dfp.utils.control_message_utils import DATA_TYPE_ROUTER_KEYS
+from morpheus_dfp.utils.control_message_utils import data_type_key_fn
 from morpheus_dfp.utils.module_ids import DFP_DATA_PREP
 from morpheus_dfp.utils.module_ids import DFP_PREPROC
 from morpheus_dfp.utils.module_ids import DFP_ROLLING_WINDOW
@@ -140,10 +143,16 @@ def dfp_training_pipe(builder: mrc.Builder):
     #                   |
     #                   v
     # +-------------------------------------+
-    # |     dfp_rolling_window_module       |
+    # |          data_type_router           |
     # +-------------------------------------+
-    #                   |
-    #                   v
+    #            |              |
+    #            v (streaming)  |
+    # +---------------------+   | (payload)
+    # |  dfp_rolling_window |   |
+    # |       _module       |   |
+    # +---------------------+   |
+    #            |              |
+    #            v              v
     # +-------------------------------------+
     # |        dfp_data_prep_module         |
     # +-------------------------------------+
@@ -280,15 +289,28 @@ def dfp_training_pipe(builder: mrc.Builder):
                                                                    module_config=mlflow_model_writer_module_conf)
     mlflow_model_writer_monitor_module = mlflow_model_writer_loader.load(builder=builder)
 
-    # Make an edge between the modules.
-    builder.make_edge(preproc_module.output_port("output"), dfp_rolling_window_module.input_port("input"))
+    # Explicit training or inference payloads don't need a rolling window, so they are routed directly to data prep
+    data_type_router = Router(builder,
+                              "data_type_router",
+                              router_keys=DATA_TYPE_ROUTER_KEYS,
+                              key_fn=data_type_key_fn)
+
+    builder.make_edge(preproc_module.output_port("output"), data_type_router)
+    builder.make_edge(data_type_router.get_source("streaming"), dfp_rolling_window_module.input_port("input"))
+    builder.make_edge(data_type_router.get_source("payload"), dfp_data_prep_module.input_port("input"))
     builder.make_edge(dfp_rolling_window_module.output_port("output"), dfp_data_prep_module.input_port("input"))
-    builder.make_edge(dfp_data_prep_module.output_port("output"), dfp_data_prep_monitor_module.input_port("input"))
-    builder.make_edge(dfp_data_prep_monitor_module.output_port("output"), dfp_training_module.input_port("input"))
-    builder.make_edge(dfp_training_module.output_port("output"), dfp_training_monitor_module.input_port("input"))
-    builder.make_edge(dfp_training_monitor_module.output_port("output"), mlflow_model_writer_module.input_port("input"))
-    builder.make_edge(mlflow_model_writer_module.output_port("output"),
-                      mlflow_model_writer_monitor_module.input_port("input"))
+
+    # Make an edge between each of the remaining modules, which are connected in a linear chain.
+    module_chain = (
+        dfp_data_prep_module,
+        dfp_data_prep_monitor_module,
+        dfp_training_module,
+        dfp_training_monitor_module,
+        mlflow_model_writer_module,
+        mlflow_model_writer_monitor_module,
+    )
+    for upstream_module, downstream_module in zip(module_chain, module_chain[1:]):
+        builder.make_edge(upstream_module.output_port("output"), downstream_module.input_port("input"))
 
     # Register input and output port for a module.
     builder.register_module_input("input", preproc_module.input_port("input"))
@@ -99,7 +99,7 @@ class DFPRollingWindowStage(SinglePortStage):
     def _get_user_cache(self, user_id: str) -> typing.Generator[CachedUserWindow, None, None]:
 
         # Determine cache location
-        cache_location = os.path.join(self._cache_dir, f"{user_id}.pkl")
+        cache_location = os.path.join(self._cache_dir, f"{user_id}.feather")
 
         user_cache = None
 
@@ -187,9 +187,9 @@ class DFPRollingWindowStage(SinglePortStage):
                     ("Rolling window complete for %s in {duration:0.2f} ms. "
                      "Input: %s rows from %s to %s. Output: %s rows from %s to %s"),
                     message.get_metadata('user_id'),
-                    len(message.payload().df),
-                    message.payload().df[self._config.ae.timestamp_column_name].min(),
-                    message.payload().df[self._config.ae.timestamp_column_name].max(),
+                    message.payload().count,
+                    message.payload().get_data(self._config.ae.timestamp_column_name).min(),
+                    message.payload().get_data(self._config.ae.timestamp_column_name).max(),
                     result.payload().count,
                     result.payload().get_data(self._config.ae.timestamp_column_name).min(),
                     result.payload().get_data(self._config.ae.timestamp_column_name).max(),
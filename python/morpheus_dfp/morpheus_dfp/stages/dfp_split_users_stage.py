@@ -126,13 +126,11 @@ class DFPSplitUsersStage(SinglePortStage):
             output_messages: list[ControlMessage] = []
             rows_per_user: list[int] = []
 
-            for user_id in sorted(split_dataframes.keys()):
+            for user_id, user_df in split_dataframes.items():
 
                 if (user_id in self._skip_users):
                     continue
 
-                user_df = split_dataframes[user_id]
-
                 current_user_count = self._user_index_map.get(user_id, 0)
 
                 # Reset the index so that users see monotonically increasing indexes
@@ -13,18 +13,35 @@
 # limitations under the License.
 
 import dataclasses
+import json
 import os
-import pickle
+import sqlite3
+import threading
 import typing
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
 
+from morpheus.utils.type_aliases import DataFrameType
+from morpheus.utils.type_aliases import SeriesType
+from morpheus.utils.type_utils import get_df_pkg_from_obj
+from morpheus.utils.type_utils import is_cudf_type
 
-@dataclasses.dataclass
+# Keys used to store the window state in the schema metadata of the saved Arrow file
+_STATE_METADATA_KEY = b"morpheus_dfp.cached_user_window.state"
+_DF_TYPE_METADATA_KEY = b"morpheus_dfp.cached_user_window.df_type"
+
+_EPOCH_FIELDS = ("min_epoch", "max_epoch", "last_train_epoch")
+
+
+@dataclasses.dataclass(slots=True)
 class CachedUserWindow:
     user_id: str
     cache_location: str
@@ -40,9 +57,30 @@ class CachedUserWindow:
     last_train_batch: int = 0
 
     _trained_rows: pd.Series = dataclasses.field(init=False, repr=False, default_factory=pd.DataFrame)
-    _df: pd.DataFrame = dataclasses.field(init=False, repr=False, default_factory=pd.DataFrame)
+    _df: DataFrameType = dataclasses.field(init=False, repr=False, default_factory=pd.DataFrame)
 
-    def append_dataframe(self, incoming_df: pd.DataFrame) -> bool:
+    @staticmethod
+    def hash_rows(df: DataFrameType) -> SeriesType:
+        """
+        Compute a hash for each row in `df` excluding the index. cuDF DataFrames are hashed on the GPU, as such the
+        hashes are only comparable with hashes computed from the same type of DataFrame.
+        """
+        if (is_cudf_type(df)):
+            return df.hash_values(method="xxhash64")
+
+        return pd.util.hash_pandas_object(df, index=False)
+
+    @staticmethod
+    def hash_boundary_rows(df: DataFrameType) -> tuple[int, int]:
+        """
+        Compute the `hash_rows` hashes of the first and last rows in `df`. The unsigned hashes are returned
+        reinterpreted as signed 64-bit integers, allowing them to be stored as `ControlMessage` metadata.
+        """
+        boundary_hashes = CachedUserWindow.hash_rows(df.iloc[[0, -1]]).to_numpy().view(np.int64)
+
+        return int(boundary_hashes[0]), int(boundary_hashes[1])
+
+    def append_dataframe(self, incoming_df: DataFrameType) -> bool:
 
         # Filter the incoming df by epochs later than the current max_epoch
         filtered_df = incoming_df[incoming_df[self.timestamp_column] > np.datetime64(self.max_epoch)]
@@ -61,13 +99,16 @@ class CachedUserWindow:
         filtered_df.index = range(self.total_count, self.total_count + len(filtered_df))
 
         # Save the row hash to make it easier to find later. Do this before the batch so it doesn't participate
-        filtered_df["_row_hash"] = pd.util.hash_pandas_object(filtered_df, index=False)
+        filtered_df["_row_hash"] = self.hash_rows(filtered_df)
 
         # Use batch id to distinguish groups in the same dataframe
         filtered_df["_batch_id"] = self.batch_count
 
-        # Append just the new rows
-        self._df = pd.concat([self._df, filtered_df])
+        # Append just the new rows, keeping the window in the same DataFrame type as the incoming data
+        if (len(self._df) == 0):
+            self._df = filtered_df
+        else:
+            self._df = get_df_pkg_from_obj(filtered_df).concat([self._df, filtered_df])
 
         self.total_count += len(filtered_df)
         self.count = len(self._df)
@@ -91,10 +132,10 @@ class CachedUserWindow:
         self.pending_batch_count = 0
         self.total_count = 0
 
-    def get_spanning_df(self, max_history) -> pd.DataFrame:
+    def get_spanning_df(self, max_history) -> DataFrameType:
         return self.get_train_df(max_history)
 
-    def get_train_df(self, max_history) -> pd.DataFrame:
+    def get_train_df(self, max_history) -> DataFrameType:
 
         new_df = self.trim_dataframe(self._df,
                                      max_history=max_history,
@@ -121,14 +162,51 @@ class CachedUserWindow:
         # Make sure the directories exist
         os.makedirs(os.path.dirname(self.cache_location), exist_ok=True)
 
-        with open(self.cache_location, "wb") as f:
-            pickle.dump(self, f)
+        feather.write_feather(self._to_arrow_table(), self.cache_location, compression="lz4")
+
+    def to_bytes(self) -> bytes:
+        """Serialize the window, including the cached DataFrame, to an Arrow IPC buffer."""
+        table = self._to_arrow_table()
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_file(sink, table.schema, options=pa.ipc.IpcWriteOptions(compression="lz4")) as writer:
+            writer.write_table(table)
+
+        return sink.getvalue().to_pybytes()
+
+    def _to_arrow_table(self) -> pa.Table:
+        if (is_cudf_type(self._df)):
+            df_type = b"cudf"
+            table = self._df.to_arrow(preserve_index=True)
+        else:
+            df_type = b"pandas"
+            table = pa.Table.from_pandas(self._df, preserve_index=True)
+
+        metadata = table.schema.metadata or {}
+        metadata.update({_STATE_METADATA_KEY: json.dumps(self._get_state()).encode(), _DF_TYPE_METADATA_KEY: df_type})
+
+        return table.replace_schema_metadata(metadata)
+
+    def _get_state(self) -> dict[str, typing.Any]:
+        state = {}
+        for field in dataclasses.fields(self):
+            # Only the constructor arguments are needed, the DataFrame is stored separately
+            if (not field.init):
+                continue
+
+            value = getattr(self, field.name)
+            if (field.name in _EPOCH_FIELDS and value is not None):
+                value = pd.Timestamp(value).isoformat()
+
+            state[field.name] = value
+
+        return state
 
     @staticmethod
-    def trim_dataframe(df: pd.DataFrame,
+    def trim_dataframe(df: DataFrameType,
                        max_history: typing.Union[int, str],
                        last_batch: int,
-                       timestamp_column: str = "timestamp") -> pd.DataFrame:
+                       timestamp_column: str = "timestamp") -> DataFrameType:
         if (max_history is None):
             return df
 
@@ -158,5 +236,93 @@ class CachedUserWindow:
         if (cache_location is None):
             raise RuntimeError("No cache location set")
 
-        with open(cache_location, "rb") as f:
-            return pickle.load(f)
+        # Memory map the file to avoid an additional copy when reading the Arrow data
+        return CachedUserWindow._from_arrow_table(feather.read_table(cache_location, memory_map=True))
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "CachedUserWindow":
+        """Deserialize a window previously serialized with `to_bytes`."""
+        return CachedUserWindow._from_arrow_table(pa.ipc.open_file(pa.py_buffer(data)).read_all())
+
+    @staticmethod
+    def _from_arrow_table(table: pa.Table) -> "CachedUserWindow":
+        metadata = table.schema.metadata
+
+        state = json.loads(metadata[_STATE_METADATA_KEY])
+        for field_name in _EPOCH_FIELDS:
+            if (state[field_name] is not None):
+                state[field_name] = pd.Timestamp(state[field_name])
+
+        user_window = CachedUserWindow(**state)
+
+        if (metadata[_DF_TYPE_METADATA_KEY] == b"cudf"):
+            import cudf
+            user_window._df = cudf.DataFrame.from_arrow(table)
+        else:
+            user_window._df = table.to_pandas()
+
+        return user_window
+
+
+class CachedUserWindowStore:
+    """
+    Persists the `CachedUserWindow` for any number of users in a single SQLite database keyed by the user id. Unlike
+    saving each window to its own file, the windows for many users can be written with a single transaction.
+
+    Parameters
+    ----------
+    db_path : str
+        Path to the SQLite database file, the parent directory will be created if it does not already exist.
+    """
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+
+        # Background writes are made by a single thread, ensuring they are applied in the order they were submitted
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CachedUserWindowStore")
+
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS user_windows (user_id TEXT PRIMARY KEY, data BLOB NOT NULL)")
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    def save(self, user_windows: typing.Iterable[CachedUserWindow]):
+        """Write the windows for all of the users in `user_windows` in a single transaction."""
+        self._write_rows([(user_window.user_id, user_window.to_bytes()) for user_window in user_windows])
+
+    def save_async(self, user_windows: typing.Iterable[CachedUserWindow]) -> Future:
+        """
+        Same as `save`, except the transaction is written on a background thread. The windows are serialized before
+        returning, allowing them to be modified while the write is in progress. Returns a future which completes once
+        the windows have been written.
+        """
+        rows = [(user_window.user_id, user_window.to_bytes()) for user_window in user_windows]
+
+        return self._executor.submit(self._write_rows, rows)
+
+    def _write_rows(self, rows: list[tuple[str, bytes]]):
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO user_windows (user_id, data) VALUES (?, ?)", rows)
+
+    def load(self, user_id: str) -> CachedUserWindow | None:
+        """Load the window for `user_id`, returns `None` if no window has been saved for the user."""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM user_windows WHERE user_id = ?", (user_id, )).fetchone()
+
+        if (row is None):
+            return None
+
+        return CachedUserWindow.from_bytes(row[0])
+
+    def close(self):
+        """Wait for any background writes to complete and close the database."""
+        self._executor.shutdown(wait=True)
+
+        with self._lock:
+            self._conn.close()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
 
 from morpheus.cli.utils import get_package_relative_file
@@ -27,6 +28,37 @@ from morpheus_dfp.utils.regex_utils import iso_date_regex_pattern
 from morpheus_dfp.utils.schema_utils import Schema
 
 
+# Sub-sections of the module configs which don't depend on the pipeline arguments. Module configs are converted to JSON
+# when passed to a module, so they remain plain dictionaries which are copied for each config
+_INFER_STREAM_AGGREGATION_OPTIONS = {
+    "aggregation_span": "1d",
+    "cache_to_disk": False,
+    "cache_mode": "batch",
+}
+
+_TRAIN_STREAM_AGGREGATION_OPTIONS = {
+    "aggregation_span": "60d",
+    "cache_to_disk": False,
+    "cache_mode": "aggregate",
+    "trigger_on_min_history": 300,
+    "trigger_on_min_increment": 300
+}
+
+# Only ever read by the MLflow model writer, shared by every training configuration rather than copied
+_MLFLOW_CONDA_ENV = {
+    'channels': ['defaults', 'conda-forge'],
+    'dependencies': ['python=3.10', 'pip'],
+    'pip': ['mlflow', 'dfencoder'],
+    'name': 'mlflow-env'
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _type2str(pytype: type, encoding: str) -> str:
+    # Types are pickled by reference, the result for a given type and encoding never changes
+    return pyobj2str(pytype, encoding=encoding)
+
+
 class ConfigGenerator:
 
     def __init__(self, config: Config, dfp_arg_parser: DFPArgParser, schema: Schema, encoding: str = "latin1"):
@@ -35,7 +67,7 @@ class ConfigGenerator:
         self._encoding = encoding
         self._source_schema_str = pyobj2str(schema.source, encoding=encoding)
         self._preprocess_schema_str = pyobj2str(schema.preprocess, encoding=encoding)
-        self._input_message_type = pyobj2str(ControlMessage, encoding)
+        self._input_message_type = _type2str(ControlMessage, encoding)
         self._start_time_str = self._dfp_arg_parser.time_fields.start_time.isoformat()
         self._end_time_str = self._dfp_arg_parser.time_fields.end_time.isoformat()
 
@@ -51,44 +83,61 @@ class ConfigGenerator:
 
         return module_conf
 
-    def infer_module_conf(self):
-        module_conf = {
-            "num_output_ports": 2,
+    @functools.cached_property
+    def _source_schema_conf(self) -> dict:
+        return {"schema_str": self._source_schema_str, "encoding": self._encoding}
+
+    @functools.cached_property
+    def _preprocess_schema_conf(self) -> dict:
+        return {"schema_str": self._preprocess_schema_str, "encoding": self._encoding}
+
+    @functools.cached_property
+    def _batching_options(self) -> dict:
+        return {
+            "sampling_rate_s": self._dfp_arg_parser.sample_rate_s,
+            "start_time": self._start_time_str,
+            "end_time": self._end_time_str,
+            "iso_date_regex_pattern": iso_date_regex_pattern,
+            "parser_kwargs": {
+                "lines": False, "orient": "records"
+            },
+            "schema": self._source_schema_conf
+        }
+
+    @functools.cached_property
+    def _user_splitting_options(self) -> dict:
+        return {
+            "fallback_username": self._config.ae.fallback_username,
+            "include_generic": self._dfp_arg_parser.include_generic,
+            "include_individual": self._dfp_arg_parser.include_individual,
+            "only_users": self._dfp_arg_parser.only_users,
+            "skip_users": self._dfp_arg_parser.skip_users,
+            "userid_column_name": self._config.ae.userid_column_name
+        }
+
+    def _shared_pipe_conf(self) -> dict:
+        """
+        Options shared by both the training and inference pipelines. The top-level dictionaries are shallow copies, so
+        the pipelines can each update them without affecting the other.
+        """
+        return {
             "timestamp_column_name": self._config.ae.timestamp_column_name,
             "cache_dir": self._dfp_arg_parser.cache_dir,
-            "batching_options": {
-                "sampling_rate_s": self._dfp_arg_parser.sample_rate_s,
-                "start_time": self._start_time_str,
-                "end_time": self._end_time_str,
-                "iso_date_regex_pattern": iso_date_regex_pattern,
-                "parser_kwargs": {
-                    "lines": False, "orient": "records"
-                },
-                "schema": {
-                    "schema_str": self._source_schema_str, "encoding": self._encoding
-                }
-            },
+            "batching_options": self._batching_options.copy(),
             "monitor_options": {
                 "silence_monitors": self._dfp_arg_parser.silence_monitors,
             },
-            "user_splitting_options": {
-                "fallback_username": self._config.ae.fallback_username,
-                "include_generic": self._dfp_arg_parser.include_generic,
-                "include_individual": self._dfp_arg_parser.include_individual,
-                "only_users": self._dfp_arg_parser.only_users,
-                "skip_users": self._dfp_arg_parser.skip_users,
-                "userid_column_name": self._config.ae.userid_column_name
-            },
-            "stream_aggregation_options": {
-                "aggregation_span": "1d",
-                "cache_to_disk": False,
-                "cache_mode": "batch",
-            },
+            "user_splitting_options": self._user_splitting_options.copy(),
             "preprocessing_options": {
-                "schema": {
-                    "schema_str": self._preprocess_schema_str, "encoding": self._encoding
-                }
+                "schema": self._preprocess_schema_conf
             },
+        }
+
+    def infer_module_conf(self):
+        module_conf = self._shared_pipe_conf()
+        module_conf.update({
+            "num_output_ports": 2,
+            "stream_aggregation_options": _INFER_STREAM_AGGREGATION_OPTIONS.copy(),
             "inference_options": {
                 "model_name_formatter": self._dfp_arg_parser.model_name_formatter,
                 "fallback_username": self._config.ae.fallback_username,
@@ -102,50 +151,15 @@ class ConfigGenerator:
             "write_to_file_options": {
                 "filename": f"dfp_detections_{self._dfp_arg_parser.source}.csv", "overwrite": True
             },
-        }
+        })
 
         return module_conf
 
     def train_module_conf(self):
-        module_conf = {
-            "timestamp_column_name": self._config.ae.timestamp_column_name,
-            "cache_dir": self._dfp_arg_parser.cache_dir,
-            "batching_options": {
-                "sampling_rate_s": self._dfp_arg_parser.sample_rate_s,
-                "start_time": self._start_time_str,
-                "end_time": self._end_time_str,
-                "iso_date_regex_pattern": iso_date_regex_pattern,
-                "parser_kwargs": {
-                    "lines": False, "orient": "records"
-                },
-                "cache_dir": self._dfp_arg_parser.cache_dir,
-                "schema": {
-                    "schema_str": self._source_schema_str, "encoding": self._encoding
-                }
-            },
-            "monitor_options": {
-                "silence_monitors": self._dfp_arg_parser.silence_monitors,
-            },
-            "user_splitting_options": {
-                "fallback_username": self._config.ae.fallback_username,
-                "include_generic": self._dfp_arg_parser.include_generic,
-                "include_individual": self._dfp_arg_parser.include_individual,
-                "only_users": self._dfp_arg_parser.only_users,
-                "skip_users": self._dfp_arg_parser.skip_users,
-                "userid_column_name": self._config.ae.userid_column_name
-            },
-            "stream_aggregation_options": {
-                "aggregation_span": "60d",
-                "cache_to_disk": False,
-                "cache_mode": "aggregate",
-                "trigger_on_min_history": 300,
-                "trigger_on_min_increment": 300
-            },
-            "preprocessing_options": {
-                "schema": {
-                    "schema_str": self._preprocess_schema_str, "encoding": self._encoding
-                }
-            },
+        module_conf = self._shared_pipe_conf()
+        module_conf["batching_options"]["cache_dir"] = self._dfp_arg_parser.cache_dir
+        module_conf.update({
+            "stream_aggregation_options": _TRAIN_STREAM_AGGREGATION_OPTIONS.copy(),
             "dfencoder_options": {
                 "feature_columns": self._config.ae.feature_columns, "epochs": 30, "validation_size": 0.10
             },
@@ -154,14 +168,9 @@ class ConfigGenerator:
                 "model_name_formatter": self._dfp_arg_parser.model_name_formatter,
                 "experiment_name_formatter": self._dfp_arg_parser.experiment_name_formatter,
                 "timestamp_column_name": self._config.ae.timestamp_column_name,
-                "conda_env": {
-                    'channels': ['defaults', 'conda-forge'],
-                    'dependencies': ['python=3.10', 'pip'],
-                    'pip': ['mlflow', 'dfencoder'],
-                    'name': 'mlflow-env'
-                }
+                "conda_env": _MLFLOW_CONDA_ENV
             }
-        }
+        })
 
         return module_conf
 
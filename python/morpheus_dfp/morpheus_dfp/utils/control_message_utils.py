@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from morpheus.messages import ControlMessage
+
+DATA_TYPE_ROUTER_KEYS = ["streaming", "payload"]
+
+
+def data_type_key_fn(control_message: ControlMessage) -> str:
+    """
+    Routing key for the DFP pipeline modules. Explicit training or inference payloads don't need a rolling window, so
+    they are routed directly to data prep, while everything else is routed through the rolling window.
+
+    Parameters
+    ----------
+    control_message : `morpheus.messages.ControlMessage`
+        The message to route.
+
+    Returns
+    -------
+    str
+        One of `DATA_TYPE_ROUTER_KEYS`.
+    """
+    if (control_message.has_metadata("data_type") and control_message.get_metadata("data_type") == "payload"):
+        return "payload"
+
+    return "streaming"
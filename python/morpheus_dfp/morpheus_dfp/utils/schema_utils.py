@@ -51,7 +51,10 @@ class SchemaBuilder:
     def _build_azure_schema(self) -> Schema:
         # Specify the column names to ensure all data is uniform
         source_column_info = [
-            DateTimeColumn(name=self._config.ae.timestamp_column_name, dtype="datetime64[ns]", input_name="time"),
+            DateTimeColumn(name=self._config.ae.timestamp_column_name,
+                           dtype="datetime64[ns]",
+                           input_name="time",
+                           format="ISO8601"),
             RenameColumn(name=self._config.ae.userid_column_name, dtype=str, input_name="properties.userPrincipalName"),
             RenameColumn(name="appDisplayName", dtype=str, input_name="properties.appDisplayName"),
             ColumnInfo(name="category", dtype=str),
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import time
 from os import path
 from unittest.mock import Mock
@@ -21,6 +22,7 @@ from xml.etree import ElementTree
 
 import feedparser
 import pytest
+import requests_cache
 from bs4 import BeautifulSoup
 
 import cudf
@@ -103,6 +105,18 @@ def test_parse_feed_invalid_input(feed_input: list[str]):
         RSSController(feed_input=feed_input)
 
 
+@pytest.mark.parametrize("cache_backend, expected_cache_type", [("sqlite", requests_cache.SQLiteCache),
+                                                                  ("filesystem", requests_cache.FileCache)])
+def test_cache_backend(tmp_path: str, cache_backend: str, expected_cache_type: type):
+    controller = RSSController(feed_input=test_file_paths,
+                               enable_cache=True,
+                               cache_dir=str(tmp_path),
+                               cache_backend=cache_backend)
+
+    assert isinstance(controller._session, requests_cache.CachedSession)
+    assert isinstance(controller._session.cache, expected_cache_type)
+
+
 @pytest.mark.parametrize("strip_markup", [False, True])
 @pytest.mark.parametrize("feed_input, expected_count", [(test_file_paths[0], 30)])
 def test_skip_duplicates_feed_inputs(feed_input: str, expected_count: int, strip_markup: bool):
@@ -242,6 +256,79 @@ def test_parse_feeds(mock_feed: feedparser.FeedParserDict):
             controller.get_feed_stats("http://testfeed.com")
 
 
+def test_entries_to_columns():
+    entries = [{"id": "1", "title": "a"}, {"title": "b", "link": "https://nvidia.com"}, {"id": "3"}]
+
+    columns = RSSController._entries_to_columns(entries)
+
+    assert list(columns.keys()) == ["id", "title", "link"]
+    assert columns == {
+        "id": ["1", None, "3"], "title": ["a", "b", None], "link": [None, "https://nvidia.com", None]
+    }
+
+
+def test_entry_fingerprint_without_id():
+    entry_a = {"title": "a", "link": "https://nvidia.com/a"}
+    entry_b = {"title": "b", "link": "https://nvidia.com/b"}
+
+    assert RSSController._entry_fingerprint(entry_a) != RSSController._entry_fingerprint(entry_b)
+    assert RSSController._entry_fingerprint(entry_a) == RSSController._entry_fingerprint(dict(entry_a))
+    assert RSSController._entry_fingerprint({"id": "1", **entry_a}) == RSSController._entry_fingerprint({"id": "1"})
+
+
+def test_parse_feeds_multiple_urls(mock_feed: feedparser.FeedParserDict, mock_get_response: Mock):
+    feed_input = [test_urls[0], "https://fake.nvidia.com/rss/Other.xml"]
+    controller = RSSController(feed_input=feed_input, enable_cache=False)
+
+    with patch("morpheus.controllers.rss_controller.feedparser.parse", return_value=mock_feed):
+        with patch("requests.Session.get", return_value=mock_get_response) as mocked_session_get:
+            feeds = list(controller.parse_feeds())
+
+    assert len(feeds) == len(feed_input)
+    assert mocked_session_get.call_count == len(feed_input)
+
+    for url in feed_input:
+        feed_stats: FeedStats = controller.get_feed_stats(url)
+        assert feed_stats.last_try_result == "Success"
+        assert feed_stats.success_count == 1
+
+
+def test_parse_feeds_preserves_order():
+    feed_input = [test_urls[0], "https://fake.nvidia.com/rss/Other.xml"]
+    controller = RSSController(feed_input=feed_input, enable_cache=False)
+
+    def try_parse_feed(url: str):
+        # Finish the first feed last
+        if (url == feed_input[0]):
+            time.sleep(0.2)
+
+        return url
+
+    with patch.object(controller, "_try_parse_feed", side_effect=try_parse_feed):
+        assert list(controller.parse_feeds()) == feed_input
+
+
+def test_parse_feeds_session_per_worker(mock_feed: feedparser.FeedParserDict, mock_get_response: Mock):
+    feed_input = [test_urls[0], "https://fake.nvidia.com/rss/Other.xml"]
+    controller = RSSController(feed_input=feed_input, enable_cache=False)
+
+    # Both requests must be in flight at the same time to pass the barrier
+    barrier = threading.Barrier(len(feed_input), timeout=5)
+    sessions = []
+
+    def session_get(session, *_, **__):
+        sessions.append(session)
+        barrier.wait()
+        return mock_get_response
+
+    with patch("morpheus.controllers.rss_controller.feedparser.parse", return_value=mock_feed):
+        with patch("requests.Session.get", autospec=True, side_effect=session_get):
+            feeds = list(controller.parse_feeds())
+
+    assert len(feeds) == len(feed_input)
+    assert sessions[0] is not sessions[1]
+
+
 @pytest.mark.parametrize("strip_markup", [False, True])
 @pytest.mark.parametrize("feed_input", [test_urls[0]])
 def test_redundant_fetch(feed_input: str,
@@ -258,6 +345,25 @@ def test_redundant_fetch(feed_input: str,
         assert mocked_session_get.call_count == 1
 
 
+@pytest.mark.parametrize("status_code", [200, 304])
+def test_unchanged_feed_not_reparsed(mock_feed: feedparser.FeedParserDict, mock_get_response: Mock, status_code: int):
+    controller = RSSController(feed_input=test_urls[0])
+
+    first_response = Mock(status_code=200, content=mock_get_response.content, headers={"ETag": '"1234"'})
+    second_response = Mock(status_code=status_code,
+                           content=(mock_get_response.content if status_code == 200 else b""),
+                           headers={"ETag": '"1234"'})
+
+    with patch("morpheus.controllers.rss_controller.feedparser.parse", return_value=mock_feed) as mock_feedparser_parse:
+        with patch("requests.Session.get", side_effect=[first_response, second_response]) as mocked_session_get:
+            first_feed = controller._try_parse_feed(test_urls[0])
+            second_feed = controller._try_parse_feed(test_urls[0])
+
+    assert second_feed is first_feed
+    assert mock_feedparser_parse.call_count == 1
+    assert mocked_session_get.call_args.kwargs["headers"] == {"If-None-Match": '"1234"'}
+
+
 @pytest.mark.parametrize("strip_markup", [False, True])
 def test_strip_markup(cisa_rss_feed: list[str], strip_markup: bool):
     # Construct expected data
@@ -356,6 +356,35 @@ def test_cast_cpp_to_python(dataset: DatasetManager):
     DatasetManager.assert_compare_df(py_meta.copy_dataframe(), df)
 
 
+def test_get_meta_range(df: DataFrameType):
+    """
+    Test that get_meta_range returns rows by position regardless of the index
+    """
+    meta = MessageMeta(df)
+    col_name = df.columns[0]
+    expected_df = df.iloc[2:7]
+
+    DatasetManager.assert_df_equal(meta.get_meta_range(2, 5), expected_df)
+    DatasetManager.assert_df_equal(meta.get_meta_range(2, 5, columns=[col_name]), expected_df[[col_name]])
+    DatasetManager.assert_df_equal(meta.get_meta_range(2, 5, columns=col_name), expected_df[col_name])
+
+
+def test_copy_ranges(df: DataFrameType):
+    """
+    Test that copy_ranges returns a copy of the rows in each range, in order
+    """
+    meta = MessageMeta(df)
+    ranges = [(0, 1), (3, 6)]
+
+    copied_meta = meta.copy_ranges(ranges)
+
+    expected_df = df.iloc[[0, 3, 4, 5]]
+    DatasetManager.assert_df_equal(copied_meta.copy_dataframe(), expected_df)
+
+    # An empty list of ranges results in an empty DataFrame
+    assert meta.copy_ranges([]).count == 0
+
+
 def test_get_column_names(df: DataFrameType):
     """
     Test that we can get the column names from a MessageMeta
@@ -198,6 +198,27 @@ def test_date_column():
     assert datetime_series.dtype == np.dtype("datetime64[ns]")
 
 
+@pytest.mark.parametrize("time_format", ["ISO8601", "%Y-%m-%dT%H:%M:%S.%fZ"])
+def test_date_column_format(time_format: str):
+    time_series = pd.Series([
+        "2022-08-29T21:21:41.645157Z",
+        "2022-08-29T21:23:19.500982Z",
+        "2022-08-29T21:40:16.765798Z",
+        "2022-08-29T22:23:15.895201Z",
+        "2022-08-29T22:05:45.076460Z"
+    ])
+
+    df = pd.DataFrame({"time": time_series})
+
+    datetime_col = DateTimeColumn(name="timestamp", dtype=datetime, input_name="time", format=time_format)
+    inferred_col = DateTimeColumn(name="timestamp", dtype=datetime, input_name="time")
+
+    datetime_series = datetime_col._process_column(df)
+
+    assert datetime_series.dtype == np.dtype("datetime64[ns]")
+    assert datetime_series.equals(inferred_col._process_column(df))
+
+
 def test_rename_column():
     time_series = pd.Series([
         "2022-08-29T21:21:41.645157Z",
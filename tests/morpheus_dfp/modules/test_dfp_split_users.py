@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+import pandas as pd
+import pytest
+
+from _utils.dataset_manager import DatasetManager
+from morpheus.config import Config
+from morpheus.messages import ControlMessage
+from morpheus.messages import MessageMeta
+from morpheus.pipeline import LinearPipeline
+from morpheus.pipeline.stage_decorator import source
+from morpheus.stages.general.linear_modules_stage import LinearModulesStage
+from morpheus.stages.output.in_memory_sink_stage import InMemorySinkStage
+from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
+
+# pylint: disable=redundant-keyword-arg
+
+
+@source
+def source_test_stage(df) -> ControlMessage:
+    control_message = ControlMessage()
+    control_message.set_metadata("data_type", "streaming")
+    control_message.payload(MessageMeta(df=df))
+
+    yield control_message
+
+
+@pytest.mark.parametrize("num_rows, only_users", [(0, []), (4, ["unknown_user"])])
+def test_empty_generic_user(config: Config, dataset: DatasetManager, num_rows: int, only_users: list[str]):
+    import morpheus_dfp.modules  # noqa: F401 # pylint: disable=unused-import
+    from morpheus_dfp.utils.module_ids import DFP_SPLIT_USERS
+
+    df = pd.DataFrame({
+        "username": [f"user_{i % 2}" for i in range(num_rows)],
+        "timestamp": pd.to_datetime([1683054498 + i for i in range(num_rows)], unit='s'),
+    })
+
+    module_config = {
+        "module_id": DFP_SPLIT_USERS,
+        "module_name": "dfp_split_users",
+        "namespace": MORPHEUS_MODULE_NAMESPACE,
+        "include_generic": True,
+        "include_individual": True,
+        "fallback_username": "generic_user",
+        "only_users": only_users,
+    }
+
+    pipeline = LinearPipeline(config)
+    pipeline.set_source(source_test_stage(config, df=dataset.df_class(df)))
+    pipeline.add_stage(LinearModulesStage(config, module_config, input_port_name="input", output_port_name="output"))
+    sink_stage = pipeline.add_stage(InMemorySinkStage(config))
+    pipeline.run()
+
+    # The empty generic user message is still emitted, without boundary row hashes for the rolling window to use
+    sink_messages = sink_stage.get_messages()
+    assert len(sink_messages) == 1
+    assert sink_messages[0].get_metadata("user_id") == "generic_user"
+    assert sink_messages[0].payload().count == 0
+    assert not sink_messages[0].has_metadata("first_row_hash")
+    assert not sink_messages[0].has_metadata("last_row_hash")
+
+
+def test_timestamp_column_name(config: Config, dataset: DatasetManager, caplog: pytest.LogCaptureFixture):
+    import morpheus_dfp.modules  # noqa: F401 # pylint: disable=unused-import
+    from morpheus_dfp.utils.module_ids import DFP_SPLIT_USERS
+
+    # The time range of each batch is only computed when debug logging is enabled
+    caplog.set_level(logging.DEBUG, logger="morpheus.morpheus_dfp.modules.dfp_split_users")
+
+    df = pd.DataFrame({
+        "username": ["user_a", "user_b", "user_a", "user_b"],
+        "event_time": pd.to_datetime([1683054498 + i for i in range(4)], unit='s'),
+    })
+
+    module_config = {
+        "module_id": DFP_SPLIT_USERS,
+        "module_name": "dfp_split_users",
+        "namespace": MORPHEUS_MODULE_NAMESPACE,
+        "include_individual": True,
+        "timestamp_column_name": "event_time",
+    }
+
+    pipeline = LinearPipeline(config)
+    pipeline.set_source(source_test_stage(config, df=dataset.df_class(df)))
+    pipeline.add_stage(LinearModulesStage(config, module_config, input_port_name="input", output_port_name="output"))
+    sink_stage = pipeline.add_stage(InMemorySinkStage(config))
+    pipeline.run()
+
+    sink_messages = sink_stage.get_messages()
+    assert sorted(msg.get_metadata("user_id") for msg in sink_messages) == ["user_a", "user_b"]
+    assert all(msg.payload().count == 2 for msg in sink_messages)
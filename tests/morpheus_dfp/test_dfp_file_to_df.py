@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import hashlib
 import json
 import os
 from unittest import mock
@@ -27,6 +26,7 @@ from _utils import TEST_DIRS
 from _utils.dataset_manager import DatasetManager
 from morpheus.common import FileTypes
 from morpheus.config import Config
+from morpheus.controllers.file_to_df_controller import hash_file_objects
 from morpheus.controllers.file_to_df_controller import single_object_to_dataframe
 from morpheus.pipeline.preallocator_mixin import PreallocatorMixin
 from morpheus.pipeline.single_port_stage import SinglePortStage
@@ -125,9 +125,7 @@ def test_get_or_create_dataframe_from_batch_cache_miss(mock_proc_df: mock.MagicM
     mock_dask_client.__enter__.return_value = mock_dask_client
     mock_dask_client.__exit__.return_value = False
 
-    expected_hash = hashlib.md5(json.dumps([{
-        'ukey': single_file_obj.fs.ukey(single_file_obj.path)
-    }]).encode()).hexdigest()
+    expected_hash = hash_file_objects(fsspec.core.OpenFiles([single_file_obj], fs=single_file_obj.fs))
 
     expected_df = dataset_pandas['filter_probs.csv']
     expected_df.sort_values(by=['v1'], inplace=True)
@@ -173,9 +171,9 @@ def test_get_or_create_dataframe_from_batch_cache_miss(mock_proc_df: mock.MagicM
 
     dataset_pandas.assert_df_equal(output_df, expected_df)
 
-    expected_cache_file_path = os.path.join(stage._controller._cache_dir, "batches", f"{expected_hash}.pkl")
+    expected_cache_file_path = os.path.join(stage._controller._cache_dir, "batches", f"{expected_hash}.feather")
     assert os.path.exists(expected_cache_file_path)
-    dataset_pandas.assert_df_equal(pd.read_pickle(expected_cache_file_path),
+    dataset_pandas.assert_df_equal(pd.read_feather(expected_cache_file_path),
                                    expected_df[dataset_pandas['filter_probs.csv'].columns])
 
 
@@ -207,11 +205,11 @@ def test_get_or_create_dataframe_from_batch_cache_hit(mock_obf_to_df: mock.Magic
     # pylint: disable=no-member
     file_obj = fsspec.core.OpenFile(fs=file_specs.fs, path=file_specs[0].path)
 
-    hash_data = hashlib.md5(json.dumps([{'ukey': file_obj.fs.ukey(file_obj.path)}]).encode()).hexdigest()
+    hash_data = hash_file_objects(fsspec.core.OpenFiles([file_obj], fs=file_obj.fs))
 
     expected_cache_dir = os.path.join(tmp_path, "file_cache", "batches")
     os.makedirs(expected_cache_dir)
-    dataset_pandas['filter_probs.csv'].to_pickle(os.path.join(expected_cache_dir, f"{hash_data}.pkl"))
+    dataset_pandas['filter_probs.csv'].to_feather(os.path.join(expected_cache_dir, f"{hash_data}.feather"))
 
     expected_df = dataset_pandas['filter_probs.csv']
     expected_df['batch_count'] = 1
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from _utils.dataset_manager import DatasetManager
+from morpheus.utils.type_utils import is_cudf_type
+
+
+def test_save_load(tmp_path: str, dataset: DatasetManager):
+    from morpheus_dfp.utils.cached_user_window import CachedUserWindow
+
+    cache_location = os.path.join(tmp_path, "test_user.arrow")
+    user_window = CachedUserWindow(user_id="test_user", cache_location=cache_location)
+
+    df = dataset.pandas["filter_probs.csv"]
+    df["timestamp"] = pd.to_datetime([1683054498 + i for i in range(0, len(df) * 30, 30)], unit='s')
+    df = dataset.df_class(df)
+
+    assert user_window.append_dataframe(incoming_df=df)
+    user_window.save()
+
+    loaded_window = CachedUserWindow.load(cache_location)
+
+    assert loaded_window.user_id == user_window.user_id
+    assert loaded_window.total_count == user_window.total_count == len(df)
+    assert loaded_window.count == user_window.count
+    assert loaded_window.batch_count == user_window.batch_count
+    assert loaded_window.min_epoch == user_window.min_epoch
+    assert loaded_window.max_epoch == user_window.max_epoch
+    assert loaded_window.last_train_epoch is None
+
+    assert is_cudf_type(loaded_window._df) == is_cudf_type(df)
+    dataset.assert_df_equal(loaded_window._df, user_window._df)
+
+
+def test_store_save_load(tmp_path: str, dataset: DatasetManager):
+    from morpheus_dfp.utils.cached_user_window import CachedUserWindow
+    from morpheus_dfp.utils.cached_user_window import CachedUserWindowStore
+
+    df = dataset.pandas["filter_probs.csv"]
+    df["timestamp"] = pd.to_datetime([1683054498 + i for i in range(0, len(df) * 30, 30)], unit='s')
+    df = dataset.df_class(df)
+
+    user_windows = []
+    for user_id in ("user_a", "user_b"):
+        user_window = CachedUserWindow(user_id=user_id, cache_location=None)
+        assert user_window.append_dataframe(incoming_df=df)
+        user_windows.append(user_window)
+
+    store = CachedUserWindowStore(os.path.join(tmp_path, "rolling-user-data", "user_windows.db"))
+    store.save(user_windows)
+
+    for user_window in user_windows:
+        loaded_window = store.load(user_window.user_id)
+        assert loaded_window.user_id == user_window.user_id
+        assert loaded_window.total_count == user_window.total_count
+        dataset.assert_df_equal(loaded_window._df, user_window._df)
+
+    assert store.load("unknown_user") is None
+
+    store.close()
+
+
+def test_hash_boundary_rows(dataset: DatasetManager):
+    from morpheus_dfp.utils.cached_user_window import CachedUserWindow
+
+    df = dataset["filter_probs.csv"]
+
+    first_row_hash, last_row_hash = CachedUserWindow.hash_boundary_rows(df)
+
+    # The boundary hashes are signed, reinterpreting them as unsigned should match the hashes of the rows
+    boundary_hashes = np.array([first_row_hash, last_row_hash], dtype=np.int64).view(np.uint64)
+    row_hashes = CachedUserWindow.hash_rows(df).to_numpy()
+
+    assert boundary_hashes[0] == row_hashes[0]
+    assert boundary_hashes[1] == row_hashes[-1]
+
+
+def test_store_save_async(tmp_path: str, dataset: DatasetManager):
+    from morpheus_dfp.utils.cached_user_window import CachedUserWindow
+    from morpheus_dfp.utils.cached_user_window import CachedUserWindowStore
+
+    df = dataset.pandas["filter_probs.csv"]
+    df["timestamp"] = pd.to_datetime([1683054498 + i for i in range(0, len(df) * 30, 30)], unit='s')
+    df = dataset.df_class(df)
+
+    user_window = CachedUserWindow(user_id="test_user", cache_location=None)
+    assert user_window.append_dataframe(incoming_df=df)
+
+    store = CachedUserWindowStore(os.path.join(tmp_path, "user_windows.db"))
+    save_future = store.save_async([user_window])
+
+    # The window is serialized before save_async returns, modifying it afterwards doesn't change what is written
+    expected_df = user_window._df
+    user_window.flush()
+
+    save_future.result()
+
+    loaded_window = store.load("test_user")
+    assert loaded_window.total_count == len(df)
+    dataset.assert_df_equal(loaded_window._df, expected_df)
+
+    store.close()
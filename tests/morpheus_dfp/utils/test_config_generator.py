@@ -58,3 +58,23 @@ def test_constructor(config: Config, dfp_arg_parser: "DFPArgParser", schema: "Sc
     assert config_generator._encoding == "latin1"
     assert config_generator._start_time_str == "1993-04-05T06:07:08+00:00"
     assert config_generator._end_time_str == "1993-04-07T06:07:08+00:00"
+
+
+def test_module_conf(config: Config, dfp_arg_parser: "DFPArgParser", schema: "Schema"):  # noqa: F821
+    from morpheus_dfp.utils.config_generator import ConfigGenerator
+
+    config_generator = ConfigGenerator(config=config, dfp_arg_parser=dfp_arg_parser, schema=schema, encoding="latin1")
+
+    train_conf = config_generator.train_module_conf()
+    infer_conf = config_generator.infer_module_conf()
+
+    for module_conf in (train_conf, infer_conf):
+        assert module_conf["batching_options"]["start_time"] == "1993-04-05T06:07:08+00:00"
+        assert module_conf["batching_options"]["schema"]["encoding"] == "latin1"
+        assert module_conf["user_splitting_options"]["skip_users"] == ["unittest-skip-user"]
+
+    # The training specific options should not leak into the inference options
+    assert train_conf["batching_options"]["cache_dir"] == ".cache"
+    assert "cache_dir" not in infer_conf["batching_options"]
+    assert infer_conf["num_output_ports"] == 2
+    assert "num_output_ports" not in train_conf